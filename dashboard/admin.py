@@ -1,27 +1,86 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.db.models import BooleanField, ExpressionWrapper, F, Q
+from django.http import HttpResponse
+from .caching import changelist_cache_key
 from .models import Vendor, Driver, CementProduct, Order, OrderItem, Payment
+from .signals import bulk_items
+
+
+class CachedChangeListMixin:
+    """
+    Cache rendered changelist pages until dashboard data changes
+    """
+    changelist_cache_timeout = 300
+
+    def changelist_view(self, request, extra_context=None):
+        # Pending flash messages are rendered into the page, so never cache those
+        if request.method != 'GET' or len(messages.get_messages(request)):
+            return super().changelist_view(request, extra_context)
+
+        key = changelist_cache_key(self.model, request)
+        content = cache.get(key)
+        if content is not None:
+            # The cached page skips ModelAdmin.changelist_view, so repeat its
+            # permission check; access may have been revoked since it was stored
+            if not self.has_view_or_change_permission(request):
+                raise PermissionDenied
+            return HttpResponse(content)
+
+        response = super().changelist_view(request, extra_context)
+        if response.status_code == 200 and hasattr(response, 'render'):
+            response.render()
+            cache.set(key, response.content, self.changelist_cache_timeout)
+        return response
+
+
+class ListDisplayOnlyMixin:
+    """
+    Restrict changelist queries to the columns rendered in list_display
+    """
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            queryset = queryset.only(*self.list_display)
+        return queryset
 
 
 @admin.register(Vendor)
-class VendorAdmin(admin.ModelAdmin):
+class VendorAdmin(CachedChangeListMixin, ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ['name', 'company_name', 'phone', 'city', 'credit_limit', 'outstanding_balance', 'is_active']
     list_filter = ['is_active', 'city', 'state']
     search_fields = ['name', 'company_name', 'phone', 'email']
 
 
 @admin.register(Driver)
-class DriverAdmin(admin.ModelAdmin):
+class DriverAdmin(CachedChangeListMixin, ListDisplayOnlyMixin, admin.ModelAdmin):
     list_display = ['name', 'phone', 'vehicle_number', 'vehicle_type', 'vehicle_capacity', 'is_active']
     list_filter = ['is_active', 'vehicle_type']
     search_fields = ['name', 'phone', 'vehicle_number', 'license_number']
 
 
 @admin.register(CementProduct)
-class CementProductAdmin(admin.ModelAdmin):
+class CementProductAdmin(CachedChangeListMixin, admin.ModelAdmin):
     list_display = ['name', 'grade', 'weight_per_bag', 'price_per_bag', 'stock_quantity', 'is_low_stock', 'is_active']
     list_filter = ['grade', 'is_active']
     search_fields = ['name', 'grade']
 
+    def get_queryset(self, request):
+        # Compare stock against reorder level in SQL rather than per row in Python
+        return super().get_queryset(request).annotate(
+            low_stock=ExpressionWrapper(
+                Q(stock_quantity__lte=F('reorder_level')),
+                output_field=BooleanField()
+            )
+        )
+
+    @admin.display(boolean=True, ordering='low_stock', description='Low stock')
+    def is_low_stock(self, obj):
+        return obj.low_stock
+
 
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
@@ -29,16 +88,47 @@ class OrderItemInline(admin.TabularInline):
 
 
 @admin.register(Order)
-class OrderAdmin(admin.ModelAdmin):
+class OrderAdmin(CachedChangeListMixin, admin.ModelAdmin):
     list_display = ['order_number', 'vendor', 'order_date', 'delivery_date', 'status', 'payment_status', 'total_amount', 'is_active']
-    list_filter = ['status', 'payment_status', 'order_date', 'delivery_date']
+    list_filter = [
+        'status',
+        'payment_status',
+        ('order_date', admin.DateFieldListFilter),
+        ('delivery_date', admin.DateFieldListFilter),
+    ]
     search_fields = ['order_number', 'vendor__name', 'vendor__company_name']
+    list_select_related = ['vendor']
+    list_per_page = 50
+    autocomplete_fields = ['vendor', 'driver']
     inlines = [OrderItemInline]
     readonly_fields = ['order_number', 'subtotal', 'discount_amount', 'tax_amount', 'total_amount']
 
+    def get_queryset(self, request):
+        # Order.__str__ only shows the vendor name when it is already loaded,
+        # which also covers the object_repr stored in admin log entries
+        return super().get_queryset(request).select_related('vendor')
+
+    def get_search_results(self, request, queryset, search_term):
+        # Autocomplete labels are built from Order.__str__
+        queryset, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        return queryset.select_related('vendor'), may_have_duplicates
+
+    def save_related(self, request, form, formsets, change):
+        # Recalculate totals once after all inline items are saved
+        with bulk_items():
+            super().save_related(request, form, formsets, change)
+        form.instance.calculate_totals()
+
 
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
     list_display = ['order', 'payment_date', 'amount', 'payment_type', 'reference_number']
-    list_filter = ['payment_type', 'payment_date']
+    list_filter = ['payment_type', ('payment_date', admin.DateFieldListFilter)]
     search_fields = ['order__order_number', 'reference_number']
+    list_select_related = ['order', 'order__vendor']
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Label each order choice with its vendor name without a query per row
+        if db_field.name == 'order':
+            kwargs['queryset'] = Order.objects.select_related('vendor')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
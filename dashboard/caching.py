@@ -0,0 +1,62 @@
+"""
+Cache keys and invalidation helpers for dashboard pages
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+DATA_VERSION_KEY = 'dashboard:data:version'
+CHOICES_TIMEOUT = 300
+HOME_STATS_TIMEOUT = 60
+FINANCE_TIMEOUT = 300
+STATIC_PAGE_TIMEOUT = 60 * 60
+CHOICES_CHUNK_SIZE = 500
+
+
+def data_version():
+    """
+    Current version of dashboard data, bumped whenever a tracked model changes
+    """
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(DATA_VERSION_KEY, version, None)
+        version = cache.get(DATA_VERSION_KEY, version)
+    return version
+
+
+def bump_data_version():
+    """
+    Invalidate every cache entry keyed on the current data version
+    """
+    try:
+        cache.incr(DATA_VERSION_KEY)
+    except ValueError:
+        # Key was evicted; start from a value no earlier key can have used
+        cache.set(DATA_VERSION_KEY, time.time_ns(), None)
+
+
+def changelist_cache_key(model, request):
+    """
+    Per-user admin changelist key; includes the CSRF cookie so cached action
+    forms always carry a token valid for the requesting browser
+    """
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, '')
+    digest = hashlib.md5(
+        f'{request.user.pk}:{csrf_cookie}:{request.get_full_path()}'.encode()
+    ).hexdigest()
+    return f'admin:{model._meta.label_lower}:changelist:v{data_version()}:{digest}'
+
+
+def cached_options(name, queryset):
+    """
+    Rows of a .values() queryset feeding a dropdown, cached until dashboard
+    data changes
+    """
+    return cache.get_or_set(
+        f'dashboard:options:{name}:v{data_version()}',
+        lambda: list(queryset.iterator(chunk_size=CHOICES_CHUNK_SIZE)),
+        CHOICES_TIMEOUT
+    )
@@ -1,9 +1,17 @@
 """
 Forms for order management using Django Forms with OOP
 """
+import re
 from django import forms
+from django.utils import timezone
+from .widgets import input_attrs, control_attrs
 from .models import Order, OrderItem, Vendor, Driver, CementProduct
-from django.forms import inlineformset_factory
+from django.forms import BaseInlineFormSet, inlineformset_factory
+
+__all__ = ['VendorForm', 'OrderForm', 'OrderItemForm', 'OrderItemFormSet']
+
+GST_NUMBER_RE = re.compile(r'^\d{2}[A-Z0-9]{13}$')
+PINCODE_RE = re.compile(r'^\d{6}$')
 
 
 class VendorForm(forms.ModelForm):
@@ -19,65 +27,50 @@ class VendorForm(forms.ModelForm):
             'gst_number', 'credit_limit', 'outstanding_balance', 'is_active'
         ]
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter vendor/customer name',
-                'required': True
-            }),
-            'company_name': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter company name (optional)'
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'email@example.com'
-            }),
-            'phone': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': '+91 1234567890',
-                'required': True
-            }),
-            'address': forms.Textarea(attrs={
-                'class': 'form-input',
-                'rows': 3,
-                'placeholder': 'Enter complete street address',
-                'required': True
-            }),
-            'city': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'City name',
-                'required': True
-            }),
-            'state': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'State name',
-                'required': True
-            }),
-            'pincode': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': '123456',
-                'required': True,
-                'maxlength': '10'
-            }),
-            'gst_number': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': '22AAAAA0000A1Z5',
-                'maxlength': '15'
-            }),
-            'credit_limit': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'min': '0',
-                'step': '0.01',
-                'value': '0',
-                'placeholder': '0.00'
-            }),
-            'outstanding_balance': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'min': '0',
-                'step': '0.01',
-                'value': '0',
-                'placeholder': '0.00'
-            }),
+            'name': forms.TextInput(attrs=input_attrs(
+                placeholder='Enter vendor/customer name',
+                required=True
+            )),
+            'company_name': forms.TextInput(attrs=input_attrs(placeholder='Enter company name (optional)')),
+            'email': forms.EmailInput(attrs=input_attrs(placeholder='email@example.com')),
+            'phone': forms.TextInput(attrs=input_attrs(
+                placeholder='+91 1234567890',
+                required=True
+            )),
+            'address': forms.Textarea(attrs=input_attrs(
+                rows=3,
+                placeholder='Enter complete street address',
+                required=True
+            )),
+            'city': forms.TextInput(attrs=input_attrs(
+                placeholder='City name',
+                required=True
+            )),
+            'state': forms.TextInput(attrs=input_attrs(
+                placeholder='State name',
+                required=True
+            )),
+            'pincode': forms.TextInput(attrs=input_attrs(
+                placeholder='123456',
+                required=True,
+                maxlength='10'
+            )),
+            'gst_number': forms.TextInput(attrs=input_attrs(
+                placeholder='22AAAAA0000A1Z5',
+                maxlength='15'
+            )),
+            'credit_limit': forms.NumberInput(attrs=input_attrs(
+                min='0',
+                step='0.01',
+                value='0',
+                placeholder='0.00'
+            )),
+            'outstanding_balance': forms.NumberInput(attrs=input_attrs(
+                min='0',
+                step='0.01',
+                value='0',
+                placeholder='0.00'
+            )),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'form-checkbox'
             })
@@ -105,20 +98,18 @@ class VendorForm(forms.ModelForm):
     def clean_gst_number(self):
         gst = self.cleaned_data.get('gst_number')
         if gst:
-            # Basic GST format validation (15 characters)
-            if len(gst) != 15:
-                raise forms.ValidationError("GST number must be exactly 15 characters")
-            if not gst[:2].isdigit():
-                raise forms.ValidationError("GST number must start with 2 digits (state code)")
-        return gst.upper() if gst else gst
+            # GST format: 2-digit state code followed by 13 alphanumerics
+            gst = gst.upper()
+            if not GST_NUMBER_RE.match(gst):
+                raise forms.ValidationError(
+                    "GST number must be 15 characters starting with 2 digits (state code)"
+                )
+        return gst
     
     def clean_pincode(self):
         pincode = self.cleaned_data.get('pincode')
         # Remove spaces for validation
-        cleaned_pincode = pincode.replace(' ', '')
-        if not cleaned_pincode.isdigit():
-            raise forms.ValidationError("PIN code must contain only digits")
-        if len(cleaned_pincode) != 6:
+        if not PINCODE_RE.match(pincode.replace(' ', '')):
             raise forms.ValidationError("PIN code must be 6 digits")
         return pincode
     
@@ -147,50 +138,45 @@ class OrderForm(forms.ModelForm):
             'discount_percent', 'tax_percent', 'payment_method', 'notes'
         ]
         widgets = {
-            'vendor': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'driver': forms.Select(attrs={
-                'class': 'form-control'
-            }),
-            'delivery_date': forms.DateInput(attrs={
-                'class': 'form-control',
-                'type': 'date'
-            }),
-            'delivery_address': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Enter delivery address'
-            }),
-            'discount_percent': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '0',
-                'max': '100',
-                'step': '0.01',
-                'value': '0'
-            }),
-            'tax_percent': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': '0',
-                'max': '100',
-                'step': '0.01',
-                'value': '18'
-            }),
-            'payment_method': forms.Select(attrs={
-                'class': 'form-control'
-            }),
-            'notes': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3,
-                'placeholder': 'Additional notes (optional)'
-            }),
+            'vendor': forms.Select(attrs=control_attrs(required=True)),
+            'driver': forms.Select(attrs=control_attrs()),
+            'delivery_date': forms.DateInput(attrs=control_attrs(type='date')),
+            'delivery_address': forms.Textarea(attrs=control_attrs(
+                rows=3,
+                placeholder='Enter delivery address'
+            )),
+            'discount_percent': forms.NumberInput(attrs=control_attrs(
+                min='0',
+                max='100',
+                step='0.01',
+                value='0'
+            )),
+            'tax_percent': forms.NumberInput(attrs=control_attrs(
+                min='0',
+                max='100',
+                step='0.01',
+                value='18'
+            )),
+            'payment_method': forms.Select(attrs=control_attrs()),
+            'notes': forms.Textarea(attrs=control_attrs(
+                rows=3,
+                placeholder='Additional notes (optional)'
+            )),
         }
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Restrict dropdowns to active records and the columns used in labels
+        self.fields['vendor'].queryset = Vendor.objects.filter(
+            is_active=True
+        ).only('id', 'name', 'company_name').order_by('name')
+        self.fields['driver'].queryset = Driver.objects.filter(
+            is_active=True
+        ).only('id', 'name', 'vehicle_number').order_by('name')
+
     def clean_delivery_date(self):
-        from django.utils import timezone
         delivery_date = self.cleaned_data.get('delivery_date')
-        if delivery_date and delivery_date < timezone.now().date():
+        if delivery_date and delivery_date < timezone.localdate():
             raise forms.ValidationError("Delivery date cannot be in the past")
         return delivery_date
 
@@ -219,16 +205,44 @@ class OrderItemForm(forms.ModelForm):
                 'readonly': True
             }),
         }
+
+
+class BaseOrderItemFormSet(BaseInlineFormSet):
+    """
+    Order item formset that checks stock for all rows in one query
+    """
     
-    def clean_quantity(self):
-        quantity = self.cleaned_data.get('quantity')
-        product = self.cleaned_data.get('product')
+    def clean(self):
+        super().clean()
         
-        if product and quantity > product.stock_quantity:
-            raise forms.ValidationError(
-                f"Insufficient stock. Available: {product.stock_quantity} bags"
-            )
-        return quantity
+        # Collect requested quantities per product across all rows
+        requested = {}
+        rows = []
+        for form in self.forms:
+            if not hasattr(form, 'cleaned_data'):
+                continue
+            if self.can_delete and self._should_delete_form(form):
+                continue
+            product = form.cleaned_data.get('product')
+            quantity = form.cleaned_data.get('quantity')
+            if product is None or quantity is None:
+                continue
+            requested[product.pk] = requested.get(product.pk, 0) + quantity
+            rows.append((form, product.pk))
+        
+        if not requested:
+            return
+        
+        stock = dict(
+            CementProduct.objects.filter(pk__in=requested).values_list('pk', 'stock_quantity')
+        )
+        for form, product_id in rows:
+            available = stock.get(product_id, 0)
+            if requested[product_id] > available:
+                form.add_error(
+                    'quantity',
+                    f"Insufficient stock. Available: {available} bags"
+                )
 
 
 # Formset for multiple order items
@@ -236,8 +250,11 @@ OrderItemFormSet = inlineformset_factory(
     Order,
     OrderItem,
     form=OrderItemForm,
+    formset=BaseOrderItemFormSet,
     extra=1,
     min_num=1,
     validate_min=True,
-    can_delete=True
+    can_delete=True,
+    max_num=50,
+    absolute_max=50
 )
@@ -2,8 +2,11 @@
 Driver Form for CRUD operations
 """
 from django import forms
+from .widgets import input_attrs
 from .models import Driver
 
+__all__ = ['DriverForm']
+
 
 class DriverForm(forms.ModelForm):
     """
@@ -22,35 +25,15 @@ class DriverForm(forms.ModelForm):
             'is_active'
         ]
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter driver full name'
-            }),
-            'phone': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter phone number'
-            }),
-            'license_number': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter license number'
-            }),
-            'vehicle_number': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter vehicle number'
-            }),
+            'name': forms.TextInput(attrs=input_attrs(placeholder='Enter driver full name')),
+            'phone': forms.TextInput(attrs=input_attrs(placeholder='Enter phone number')),
+            'license_number': forms.TextInput(attrs=input_attrs(placeholder='Enter license number')),
+            'vehicle_number': forms.TextInput(attrs=input_attrs(placeholder='Enter vehicle number')),
             'vehicle_type': forms.Select(
-                choices=[
-                    ('Truck', 'Truck'),
-                    ('Mini Truck', 'Mini Truck'),
-                    ('Trailer', 'Trailer'),
-                    ('Tanker', 'Tanker'),
-                ],
-                attrs={'class': 'form-input'}
+                choices=Driver.VehicleType.choices,
+                attrs=input_attrs()
             ),
-            'vehicle_capacity': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Enter capacity in bags'
-            }),
+            'vehicle_capacity': forms.NumberInput(attrs=input_attrs(placeholder='Enter capacity in bags')),
             'is_active': forms.CheckboxInput(attrs={
                 'class': 'toggle-checkbox'
             })
@@ -2,42 +2,48 @@
 Stock Management Forms
 """
 from django import forms
+from django.db import models
+from .widgets import input_attrs
 from .models import CementProduct
 
+__all__ = ['AdjustmentType', 'StockUpdateForm', 'ProductCreateForm']
+
+
+class AdjustmentType(models.TextChoices):
+    """
+    Kinds of manual stock adjustment
+    """
+    ADD = 'add', 'Add Stock (Purchase/Production)'
+    REMOVE = 'remove', 'Remove Stock (Damage/Loss)'
+    SET = 'set', 'Set Stock (Manual Adjustment)'
+
 
 class StockUpdateForm(forms.ModelForm):
     """
     Form for updating stock quantities - No strict validations
     """
     adjustment_type = forms.ChoiceField(
-        choices=[
-            ('add', 'Add Stock (Purchase/Production)'),
-            ('remove', 'Remove Stock (Damage/Loss)'),
-            ('set', 'Set Stock (Manual Adjustment)')
-        ],
-        widget=forms.Select(attrs={
-            'class': 'form-input',
-            'id': 'adjustmentType'
-        }),
-        initial='add'
+        choices=AdjustmentType.choices,
+        widget=forms.Select(attrs=input_attrs(id='adjustmentType')),
+        initial=AdjustmentType.ADD
     )
     
     adjustment_quantity = forms.IntegerField(
-        widget=forms.NumberInput(attrs={
-            'class': 'form-input',
-            'placeholder': 'Enter quantity',
-            'id': 'adjustmentQuantity'
-        }),
+        min_value=0,
+        widget=forms.NumberInput(attrs=input_attrs(
+            placeholder='Enter quantity',
+            id='adjustmentQuantity',
+            min='0'
+        )),
         label='Quantity'
     )
     
     adjustment_reason = forms.CharField(
         required=False,
-        widget=forms.Textarea(attrs={
-            'class': 'form-input',
-            'placeholder': 'Reason for stock adjustment (optional)',
-            'rows': 3
-        }),
+        widget=forms.Textarea(attrs=input_attrs(
+            placeholder='Reason for stock adjustment (optional)',
+            rows=3
+        )),
         label='Reason/Notes'
     )
     
@@ -45,26 +51,14 @@ class StockUpdateForm(forms.ModelForm):
         model = CementProduct
         fields = ['name', 'grade', 'weight_per_bag', 'price_per_bag', 'reorder_level']
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'Product Name',
-                'readonly': 'readonly'
-            }),
-            'grade': forms.Select(attrs={
-                'class': 'form-input',
-                'disabled': 'disabled'
-            }),
-            'weight_per_bag': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'readonly': 'readonly'
-            }),
-            'price_per_bag': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'step': '0.01'
-            }),
-            'reorder_level': forms.NumberInput(attrs={
-                'class': 'form-input'
-            })
+            'name': forms.TextInput(attrs=input_attrs(
+                placeholder='Product Name',
+                readonly='readonly'
+            )),
+            'grade': forms.Select(attrs=input_attrs(disabled='disabled')),
+            'weight_per_bag': forms.NumberInput(attrs=input_attrs(readonly='readonly')),
+            'price_per_bag': forms.NumberInput(attrs=input_attrs(step='0.01')),
+            'reorder_level': forms.NumberInput(attrs=input_attrs())
         }
         labels = {
             'name': 'Product Name',
@@ -73,16 +67,27 @@ class StockUpdateForm(forms.ModelForm):
             'price_per_bag': 'Price per Bag (₹)',
             'reorder_level': 'Reorder Level (Bags)'
         }
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        adjustment_type = cleaned_data.get('adjustment_type')
+        quantity = cleaned_data.get('adjustment_quantity')
+        
+        # Setting stock to zero is allowed; adding or removing nothing is not
+        if quantity == 0 and adjustment_type in (AdjustmentType.ADD, AdjustmentType.REMOVE):
+            self.add_error('adjustment_quantity', 'Quantity must be at least 1 bag')
+        
+        return cleaned_data
+
+
 class ProductCreateForm(forms.ModelForm):
     """
     Form for creating new cement products - No validations
     """
     initial_stock = forms.IntegerField(
         initial=0,
-        widget=forms.NumberInput(attrs={
-            'class': 'form-input',
-            'placeholder': 'Initial stock quantity'
-        }),
+        min_value=0,
+        widget=forms.NumberInput(attrs=input_attrs(placeholder='Initial stock quantity', min='0')),
         label='Initial Stock Quantity',
         help_text='Number of bags to add initially'
     )
@@ -91,27 +96,17 @@ class ProductCreateForm(forms.ModelForm):
         model = CementProduct
         fields = ['name', 'grade', 'weight_per_bag', 'price_per_bag', 'reorder_level']
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-input',
-                'placeholder': 'e.g., UltraTech Cement'
-            }),
-            'grade': forms.Select(attrs={
-                'class': 'form-input'
-            }),
-            'weight_per_bag': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'step': '0.01',
-                'value': '50.00'
-            }),
-            'price_per_bag': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'step': '0.01',
-                'placeholder': 'Price per bag'
-            }),
-            'reorder_level': forms.NumberInput(attrs={
-                'class': 'form-input',
-                'value': '100'
-            })
+            'name': forms.TextInput(attrs=input_attrs(placeholder='e.g., UltraTech Cement')),
+            'grade': forms.Select(attrs=input_attrs()),
+            'weight_per_bag': forms.NumberInput(attrs=input_attrs(
+                step='0.01',
+                value='50.00'
+            )),
+            'price_per_bag': forms.NumberInput(attrs=input_attrs(
+                step='0.01',
+                placeholder='Price per bag'
+            )),
+            'reorder_level': forms.NumberInput(attrs=input_attrs(value='100'))
         }
         labels = {
             'name': 'Product Name',
@@ -0,0 +1,21 @@
+"""
+JSON serialization for data embedded in dashboard pages
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['dumps']
+
+
+def dumps(data):
+    """
+    Serialize to a JSON string, using orjson when it is installed.
+    Decimals and dates fall back to str().
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, default=str)
@@ -1,7 +1,10 @@
 """
 Management command to populate sample data
 """
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from dashboard.caching import bump_data_version
 from dashboard.models import Vendor, Driver, CementProduct
 from decimal import Decimal
 
@@ -9,8 +12,10 @@ from decimal import Decimal
 class Command(BaseCommand):
     help = 'Populate sample data for testing'
 
+    @transaction.atomic
     def handle(self, *args, **kwargs):
         self.stdout.write('Creating sample data...')
+        batch_size = getattr(settings, 'BULK_CREATE_BATCH_SIZE', 100)
         
         # Create Vendors
         vendors_data = [
@@ -55,13 +60,16 @@ class Command(BaseCommand):
             }
         ]
         
-        for vendor_data in vendors_data:
-            Vendor.objects.get_or_create(
-                phone=vendor_data['phone'],
-                defaults=vendor_data
-            )
+        # Skip vendors that already exist (matched on phone)
+        existing_phones = set(
+            Vendor.objects.filter(
+                phone__in=[d['phone'] for d in vendors_data]
+            ).values_list('phone', flat=True)
+        )
+        vendors = [Vendor(**d) for d in vendors_data if d['phone'] not in existing_phones]
+        Vendor.objects.bulk_create(vendors, batch_size=batch_size, ignore_conflicts=True)
         
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(vendors_data)} vendors'))
+        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(vendors)} vendors'))
         
         # Create Drivers
         drivers_data = [
@@ -91,13 +99,16 @@ class Command(BaseCommand):
             }
         ]
         
-        for driver_data in drivers_data:
-            Driver.objects.get_or_create(
-                license_number=driver_data['license_number'],
-                defaults=driver_data
-            )
+        # Skip drivers that already exist (license_number is unique)
+        existing_licenses = set(
+            Driver.objects.filter(
+                license_number__in=[d['license_number'] for d in drivers_data]
+            ).values_list('license_number', flat=True)
+        )
+        drivers = [Driver(**d) for d in drivers_data if d['license_number'] not in existing_licenses]
+        Driver.objects.bulk_create(drivers, batch_size=batch_size, ignore_conflicts=True)
         
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(drivers_data)} drivers'))
+        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(drivers)} drivers'))
         
         # Create Cement Products
         products_data = [
@@ -143,13 +154,22 @@ class Command(BaseCommand):
             }
         ]
         
-        for product_data in products_data:
-            CementProduct.objects.get_or_create(
-                name=product_data['name'],
-                grade=product_data['grade'],
-                defaults=product_data
-            )
+        # Skip products that already exist (matched on name and grade)
+        existing_products = set(
+            CementProduct.objects.filter(
+                name__in=[d['name'] for d in products_data]
+            ).values_list('name', 'grade')
+        )
+        products = [
+            CementProduct(**d) for d in products_data
+            if (d['name'], d['grade']) not in existing_products
+        ]
+        CementProduct.objects.bulk_create(products, batch_size=batch_size, ignore_conflicts=True)
+        
+        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(products)} products'))
         
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(products_data)} products'))
+        # bulk_create does not send post_save, so invalidate cached pages
+        # once the seed data is committed
+        transaction.on_commit(bump_data_version)
         
         self.stdout.write(self.style.SUCCESS('\n✅ Sample data created successfully!'))
@@ -0,0 +1,57 @@
+"""
+Development middleware guarding per-view query budgets
+"""
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCounter:
+    """
+    Database execute wrapper that records every SQL statement run
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+
+class QueryCountMiddleware:
+    """
+    Count queries per request (DEBUG only), expose them in an X-Query-Count
+    header and log a warning when a view exceeds its QUERY_COUNT_BUDGETS entry
+    """
+
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.budgets = getattr(settings, 'QUERY_COUNT_BUDGETS', {})
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        count = len(counter.queries)
+        response['X-Query-Count'] = str(count)
+
+        match = request.resolver_match
+        budget = self.budgets.get(match.view_name) if match else None
+        if budget is not None and count > budget:
+            # The most repeated statement is usually the N+1 culprit
+            sql, repeats = Counter(counter.queries).most_common(1)[0]
+            logger.warning(
+                'Query budget exceeded for %s: %d queries (budget %d). '
+                'Most repeated (%dx): %s',
+                match.view_name, count, budget, repeats, sql
+            )
+        return response
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0003_alter_driver_phone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='driver',
+            name='phone',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='driver',
+            name='vehicle_number',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='vendor',
+            name='phone',
+            field=models.CharField(db_index=True, max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='cementproduct',
+            index=models.Index(fields=['name'], name='dashboard_c_name_04009c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='driver',
+            index=models.Index(fields=['name'], name='dashboard_d_name_200144_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['name'], name='dashboard_v_name_7687ac_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['company_name'], name='dashboard_v_company_b31204_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_order_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyOrderCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('last_seq', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
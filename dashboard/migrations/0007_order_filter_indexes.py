@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0006_daily_order_counter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cementproduct',
+            index=models.Index(fields=['grade', 'stock_quantity'], name='dashboard_c_grade_116132_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['payment_status'], name='dashboard_o_payment_33090e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['delivery_date', 'status'], name='dashboard_o_deliver_08a139_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-order_date'], name='pending_orders_partial'),
+        ),
+    ]
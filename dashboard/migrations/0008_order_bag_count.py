@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:08
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_bag_count(apps, schema_editor):
+    Order = apps.get_model('dashboard', 'Order')
+    OrderItem = apps.get_model('dashboard', 'OrderItem')
+    bags = OrderItem.objects.filter(order=OuterRef('pk')).order_by().values(
+        'order'
+    ).annotate(bags=Sum('quantity')).values('bags')
+    Order.objects.update(bag_count=Coalesce(Subquery(bags), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0007_order_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='bag_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_bag_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:09
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+CENT = Decimal('0.01')
+
+
+def repair_out_of_range_values(apps, schema_editor):
+    """
+    Bring rows saved before the constraints existed into range, and refresh
+    the order totals that depend on repaired items or payments
+    """
+    CementProduct = apps.get_model('dashboard', 'CementProduct')
+    Order = apps.get_model('dashboard', 'Order')
+    OrderItem = apps.get_model('dashboard', 'OrderItem')
+    Payment = apps.get_model('dashboard', 'Payment')
+
+    CementProduct.objects.filter(stock_quantity__lt=0).update(stock_quantity=0)
+    CementProduct.objects.filter(price_per_bag__lt=0).update(price_per_bag=0)
+    Order.objects.filter(discount_percent__lt=0).update(discount_percent=0)
+
+    item_orders = set(OrderItem.objects.filter(quantity__lt=1).values_list('order_id', flat=True))
+    for item in OrderItem.objects.filter(quantity__lt=1):
+        item.quantity = 1
+        item.total_price = item.unit_price
+        item.save(update_fields=['quantity', 'total_price'])
+
+    payment_orders = set(Payment.objects.filter(amount__lt=0).values_list('order_id', flat=True))
+    Payment.objects.filter(amount__lt=0).update(amount=0)
+
+    for order in Order.objects.filter(pk__in=item_orders | payment_orders):
+        items = order.items.aggregate(total=Sum('total_price'), bags=Sum('quantity'))
+        subtotal = items['total'] or Decimal('0')
+        discount = subtotal * order.discount_percent / 100
+        tax = (subtotal - discount) * order.tax_percent / 100
+        order.subtotal = subtotal
+        order.discount_amount = discount.quantize(CENT)
+        order.tax_amount = tax.quantize(CENT)
+        order.total_amount = (subtotal - discount + tax).quantize(CENT)
+        order.bag_count = items['bags'] or 0
+        order.paid_amount = order.payments.aggregate(total=Sum('amount'))['total'] or Decimal('0')
+        if order.paid_amount >= order.total_amount:
+            order.payment_status = 'paid'
+        elif order.paid_amount > 0:
+            order.payment_status = 'partial'
+        else:
+            order.payment_status = 'unpaid'
+        order.save(update_fields=[
+            'subtotal', 'discount_amount', 'tax_amount', 'total_amount',
+            'bag_count', 'paid_amount', 'payment_status',
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0008_order_bag_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(repair_out_of_range_values, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='cementproduct',
+            constraint=models.CheckConstraint(condition=models.Q(('price_per_bag__gte', 0)), name='cementproduct_price_nonneg'),
+        ),
+        migrations.AddConstraint(
+            model_name='cementproduct',
+            constraint=models.CheckConstraint(condition=models.Q(('stock_quantity__gte', 0)), name='cementproduct_stock_nonneg'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.CheckConstraint(condition=models.Q(('discount_percent__gte', 0)), name='order_discount_nonneg'),
+        ),
+        migrations.AddConstraint(
+            model_name='orderitem',
+            constraint=models.CheckConstraint(condition=models.Q(('quantity__gte', 1)), name='orderitem_quantity_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gte', 0)), name='payment_amount_nonneg'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0009_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cementproduct',
+            index=models.Index(fields=['stock_quantity'], name='dashboard_c_stock_q_e029a8_idx'),
+        ),
+    ]
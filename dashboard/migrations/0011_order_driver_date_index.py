@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0010_product_stock_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['driver', 'order_date'], name='dashboard_o_driver__7f6448_idx'),
+        ),
+    ]
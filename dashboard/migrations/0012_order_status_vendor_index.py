@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0011_order_driver_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['status', 'vendor'], name='dashboard_o_status_d79947_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0012_order_status_vendor_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(fields=['order', 'product', 'quantity', 'unit_price'], name='dashboard_o_order_i_8c0ac5_idx'),
+        ),
+    ]
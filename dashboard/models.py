@@ -1,10 +1,15 @@
 """
 Dashboard models using proper OOP principles
 """
-from django.db import models
-from django.core.validators import MinValueValidator, RegexValidator
+from django.db import models, transaction
+from django.core.validators import MinValueValidator
+from django.db.models import Avg, Case, Count, F, OuterRef, Prefetch, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Round
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual
 from django.utils import timezone
+from django.utils.functional import cached_property
 from decimal import Decimal
+from .caching import bump_data_version
 
 
 class BaseModel(models.Model):
@@ -26,7 +31,7 @@ class Vendor(BaseModel):
     name = models.CharField(max_length=200)
     company_name = models.CharField(max_length=200, blank=True)
     email = models.EmailField(blank=True)
-    phone = models.CharField(max_length=20)
+    phone = models.CharField(max_length=20, db_index=True)
     address = models.TextField()
     city = models.CharField(max_length=100)
     state = models.CharField(max_length=100)
@@ -39,11 +44,15 @@ class Vendor(BaseModel):
         ordering = ['name']
         verbose_name = 'Vendor'
         verbose_name_plural = 'Vendors'
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['company_name']),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.company_name or 'Individual'}"
     
-    @property
+    @cached_property
     def available_credit(self):
         return self.credit_limit - self.outstanding_balance
 
@@ -52,15 +61,24 @@ class Driver(BaseModel):
     """
     Driver model for delivery personnel
     """
+    class VehicleType(models.TextChoices):
+        TRUCK = 'Truck', 'Truck'
+        MINI_TRUCK = 'Mini Truck', 'Mini Truck'
+        TRAILER = 'Trailer', 'Trailer'
+        TANKER = 'Tanker', 'Tanker'
+    
     name = models.CharField(max_length=200)
-    phone = models.CharField(max_length=20)
+    phone = models.CharField(max_length=20, db_index=True)
     license_number = models.CharField(max_length=50, unique=True)
-    vehicle_number = models.CharField(max_length=20)
-    vehicle_type = models.CharField(max_length=50, default='Truck')
+    vehicle_number = models.CharField(max_length=20, db_index=True)
+    vehicle_type = models.CharField(max_length=50, default=VehicleType.TRUCK)
     vehicle_capacity = models.IntegerField(help_text="Capacity in bags")
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['name']),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.vehicle_number}"
@@ -70,16 +88,17 @@ class CementProduct(BaseModel):
     """
     Cement product/grade model
     """
-    GRADE_CHOICES = [
-        ('33', 'Grade 33'),
-        ('43', 'Grade 43'),
-        ('53', 'Grade 53'),
-        ('PPC', 'Portland Pozzolana Cement'),
-        ('PSC', 'Portland Slag Cement'),
-    ]
+    class Grade(models.TextChoices):
+        GRADE_33 = '33', 'Grade 33'
+        GRADE_43 = '43', 'Grade 43'
+        GRADE_53 = '53', 'Grade 53'
+        PPC = 'PPC', 'Portland Pozzolana Cement'
+        PSC = 'PSC', 'Portland Slag Cement'
+    
+    GRADE_CHOICES = Grade.choices
     
     name = models.CharField(max_length=200)
-    grade = models.CharField(max_length=10, choices=GRADE_CHOICES)
+    grade = models.CharField(max_length=10, choices=Grade.choices)
     weight_per_bag = models.DecimalField(max_digits=5, decimal_places=2, default=50.00, help_text="Weight in KG")
     price_per_bag = models.DecimalField(max_digits=8, decimal_places=2, validators=[MinValueValidator(0)])
     stock_quantity = models.IntegerField(default=0, validators=[MinValueValidator(0)])
@@ -89,44 +108,127 @@ class CementProduct(BaseModel):
         ordering = ['grade', 'name']
         verbose_name = 'Cement Product'
         verbose_name_plural = 'Cement Products'
+        indexes = [
+            models.Index(fields=['name']),
+            models.Index(fields=['grade', 'stock_quantity']),
+            models.Index(fields=['stock_quantity']),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(price_per_bag__gte=0), name='cementproduct_price_nonneg'),
+            models.CheckConstraint(condition=models.Q(stock_quantity__gte=0), name='cementproduct_stock_nonneg'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.get_grade_display()}"
     
-    @property
+    @cached_property
     def is_low_stock(self):
         return self.stock_quantity <= self.reorder_level
     
-    @property
+    @cached_property
     def stock_value(self):
         return self.stock_quantity * self.price_per_bag
 
 
+class DailyOrderCounter(models.Model):
+    """
+    Per-day sequence used to generate order numbers
+    """
+    date = models.DateField(unique=True)
+    last_seq = models.PositiveIntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.date} - {self.last_seq}"
+    
+    @classmethod
+    def reserve(cls, day, count=1):
+        """Atomically reserve `count` sequence numbers for a day and return the first"""
+        with transaction.atomic():
+            counter, _ = cls.objects.select_for_update().get_or_create(
+                date=day,
+                # Continue after numbers issued before the counter existed
+                defaults={'last_seq': lambda: cls._last_issued_seq(day)}
+            )
+            first = counter.last_seq + 1
+            counter.last_seq += count
+            counter.save(update_fields=['last_seq'])
+        return first
+    
+    @staticmethod
+    def _last_issued_seq(day):
+        last_number = Order.objects.filter(
+            order_number__startswith=f'ORD-{day:%Y%m%d}-'
+        ).order_by('-order_number').values_list('order_number', flat=True).first()
+        return int(last_number.split('-')[-1]) if last_number else 0
+
+
+class OrderQuerySet(models.QuerySet):
+    def with_related(self):
+        """
+        Load vendor, driver and line items with their products in 3 queries
+        """
+        return self.select_related('vendor', 'driver').prefetch_related(
+            Prefetch('items', queryset=OrderItem.objects.select_related('product'))
+        )
+    
+    def unordered(self):
+        """
+        Drop Meta.ordering for queries that aggregate or re-sort anyway
+        """
+        return self.order_by()
+    
+    def finance_summary(self, since, until, **extra):
+        """
+        Order count, revenue, collections and bags for a date range in one query;
+        callers can add further aggregates through `extra`
+        """
+        delivered = Q(status='delivered')
+        open_orders = Q(status__in=['pending', 'confirmed', 'processing', 'dispatched'])
+        return self.filter(order_date__date__range=(since, until)).aggregate(
+            revenue=Sum('total_amount'),
+            collected=Sum('paid_amount'),
+            orders=Count('id'),
+            bags=Sum('bag_count'),
+            delivered_revenue=Sum('total_amount', filter=delivered),
+            delivered_orders=Count('id', filter=delivered),
+            avg_delivered=Avg('total_amount', filter=delivered),
+            pending_revenue=Sum('total_amount', filter=open_orders),
+            **extra,
+        )
+    
+    def delete(self):
+        # Items go with their orders, so don't recalculate totals per item
+        from .signals import bulk_items
+        with bulk_items():
+            return super().delete()
+
+
 class Order(BaseModel):
     """
     Main order model
     """
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('confirmed', 'Confirmed'),
-        ('processing', 'Processing'),
-        ('dispatched', 'Dispatched'),
-        ('delivered', 'Delivered'),
-        ('cancelled', 'Cancelled'),
-    ]
-    
-    PAYMENT_STATUS_CHOICES = [
-        ('unpaid', 'Unpaid'),
-        ('partial', 'Partially Paid'),
-        ('paid', 'Paid'),
-    ]
-    
-    PAYMENT_METHOD_CHOICES = [
-        ('cash', 'Cash'),
-        ('cheque', 'Cheque'),
-        ('online', 'Online Transfer'),
-        ('credit', 'Credit'),
-    ]
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        CONFIRMED = 'confirmed', 'Confirmed'
+        PROCESSING = 'processing', 'Processing'
+        DISPATCHED = 'dispatched', 'Dispatched'
+        DELIVERED = 'delivered', 'Delivered'
+        CANCELLED = 'cancelled', 'Cancelled'
+    
+    class PaymentStatus(models.TextChoices):
+        UNPAID = 'unpaid', 'Unpaid'
+        PARTIAL = 'partial', 'Partially Paid'
+        PAID = 'paid', 'Paid'
+    
+    class PaymentMethod(models.TextChoices):
+        CASH = 'cash', 'Cash'
+        CHEQUE = 'cheque', 'Cheque'
+        ONLINE = 'online', 'Online Transfer'
+        CREDIT = 'credit', 'Credit'
+    
+    STATUS_CHOICES = Status.choices
+    PAYMENT_STATUS_CHOICES = PaymentStatus.choices
+    PAYMENT_METHOD_CHOICES = PaymentMethod.choices
     
     order_number = models.CharField(max_length=20, unique=True, editable=False)
     vendor = models.ForeignKey(Vendor, on_delete=models.PROTECT, related_name='orders')
@@ -136,9 +238,9 @@ class Order(BaseModel):
     delivery_date = models.DateField(null=True, blank=True)
     delivery_address = models.TextField()
     
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
-    payment_status = models.CharField(max_length=20, choices=PAYMENT_STATUS_CHOICES, default='unpaid')
-    payment_method = models.CharField(max_length=20, choices=PAYMENT_METHOD_CHOICES, default='cash')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    payment_status = models.CharField(max_length=20, choices=PaymentStatus.choices, default=PaymentStatus.UNPAID)
+    payment_method = models.CharField(max_length=20, choices=PaymentMethod.choices, default=PaymentMethod.CASH)
     
     subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     discount_percent = models.DecimalField(max_digits=5, decimal_places=2, default=0, validators=[MinValueValidator(0)])
@@ -147,60 +249,117 @@ class Order(BaseModel):
     tax_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     paid_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    # Sum of item quantities, kept in step by calculate_totals() and signals
+    bag_count = models.PositiveIntegerField(default=0, editable=False)
     
     notes = models.TextField(blank=True)
     
+    objects = OrderQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-order_date']
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
+        indexes = [
+            models.Index(fields=['-order_date']),
+            models.Index(fields=['status', 'order_date']),
+            models.Index(fields=['payment_status']),
+            models.Index(fields=['delivery_date', 'status']),
+            models.Index(fields=['driver', 'order_date']),
+            models.Index(fields=['status', 'vendor']),
+            models.Index(
+                fields=['-order_date'],
+                condition=models.Q(status='pending'),
+                name='pending_orders_partial'
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(discount_percent__gte=0), name='order_discount_nonneg'),
+        ]
     
     def __str__(self):
-        return f"{self.order_number} - {self.vendor.name}"
+        # Only show the vendor name when it's already loaded
+        vendor = self.vendor.name if Order.vendor.is_cached(self) else self.vendor_id
+        return f"{self.order_number} - {vendor}"
     
     def save(self, *args, **kwargs):
-        if not self.order_number:
+        # Partial updates (e.g. from calculate_totals) skip number generation
+        if not self.order_number and kwargs.get('update_fields') is None:
             # Generate order number: ORD-YYYYMMDD-XXXX
-            today = timezone.now()
-            date_str = today.strftime('%Y%m%d')
-            last_order = Order.objects.filter(
-                order_number__startswith=f'ORD-{date_str}'
-            ).order_by('order_number').last()
-            
-            if last_order:
-                last_number = int(last_order.order_number.split('-')[-1])
-                new_number = last_number + 1
-            else:
-                new_number = 1
-            
-            self.order_number = f'ORD-{date_str}-{new_number:04d}'
+            self.order_number = self.reserve_numbers(1)[0]
         
         super().save(*args, **kwargs)
     
-    def calculate_totals(self):
-        """Calculate order totals"""
-        self.subtotal = sum(item.total_price for item in self.items.all())
-        self.discount_amount = (self.subtotal * self.discount_percent) / 100
-        taxable_amount = self.subtotal - self.discount_amount
-        self.tax_amount = (taxable_amount * self.tax_percent) / 100
-        self.total_amount = taxable_amount + self.tax_amount
-        self.save()
+    @classmethod
+    def reserve_numbers(cls, n, date=None):
+        """
+        Reserve n consecutive order numbers with one counter update,
+        for callers that set order_number before bulk_create()
+        """
+        day = date or timezone.now().date()
+        first = DailyOrderCounter.reserve(day, n)
+        return [f'ORD-{day:%Y%m%d}-{seq:04d}' for seq in range(first, first + n)]
+    
+    def delete(self, *args, **kwargs):
+        # Items go with the order, so don't recalculate totals per item
+        from .signals import bulk_items
+        with bulk_items():
+            return super().delete(*args, **kwargs)
+    
+    def calculate_totals(self, refresh=True):
+        """Calculate order totals; pass refresh=False to skip reloading them"""
+        # Every SET expression reads the pre-update row, so the item subtotal
+        # is repeated inside each derived column instead of using F('subtotal')
+        items_total = OrderItem.objects.filter(order=OuterRef('pk')).order_by().values(
+            'order'
+        ).annotate(total=Sum('total_price')).values('total')
+        money = self._meta.get_field('total_amount')
+        subtotal = Coalesce(Subquery(items_total), Value(Decimal('0')), output_field=money)
+        items_bags = OrderItem.objects.filter(order=OuterRef('pk')).order_by().values(
+            'order'
+        ).annotate(bags=Sum('quantity')).values('bags')
+        # Scale by 0.01 rather than dividing by 100, which SQLite truncates
+        # to integer division when the stored values are whole numbers
+        percent = Value(Decimal('0.01'))
+        discount = subtotal * F('discount_percent') * percent
+        taxable = subtotal - discount
+        tax = taxable * F('tax_percent') * percent
+        # Round each stored amount to cents as a Python save() would; SQLite
+        # otherwise keeps the full REAL result, e.g. 118.0118 for 118.01
+        Order.objects.filter(pk=self.pk).update(
+            subtotal=Round(subtotal, 2, output_field=money),
+            discount_amount=Round(discount, 2, output_field=money),
+            tax_amount=Round(tax, 2, output_field=money),
+            total_amount=Round(taxable + tax, 2, output_field=money),
+            bag_count=Coalesce(Subquery(items_bags), 0),
+            updated_at=timezone.now(),
+        )
+        # update() bypasses post_save, so invalidate cached pages here
+        bump_data_version()
+        
+        if refresh:
+            self.refresh_from_db(fields=['subtotal', 'discount_amount', 'tax_amount', 'total_amount', 'bag_count', 'updated_at'])
+            self.__dict__.pop('balance_amount', None)
     
-    @property
+    @cached_property
     def balance_amount(self):
         return self.total_amount - self.paid_amount
     
     @property
     def total_bags(self):
-        return sum(item.quantity for item in self.items.all())
+        return self.bag_count
     
-    @property
+    @cached_property
     def is_delayed(self):
-        if self.delivery_date and self.status not in ['delivered', 'cancelled']:
+        if self.delivery_date and self.status not in TERMINAL_STATUSES:
             return self.delivery_date < timezone.now().date()
         return False
 
 
+# Orders in these states can no longer be delayed
+TERMINAL_STATUSES = frozenset({Order.Status.DELIVERED, Order.Status.CANCELLED})
+
+
 class OrderItem(BaseModel):
     """
     Order line items
@@ -213,6 +372,13 @@ class OrderItem(BaseModel):
     
     class Meta:
         ordering = ['id']
+        indexes = [
+            # Covers the top products ranking without touching the table
+            models.Index(fields=['order', 'product', 'quantity', 'unit_price']),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(quantity__gte=1), name='orderitem_quantity_positive'),
+        ]
     
     def __str__(self):
         return f"{self.order.order_number} - {self.product.name} x {self.quantity}"
@@ -221,46 +387,68 @@ class OrderItem(BaseModel):
         # Calculate total price
         self.total_price = self.quantity * self.unit_price
         super().save(*args, **kwargs)
-        
-        # Update order totals
-        self.order.calculate_totals()
 
 
 class Payment(BaseModel):
     """
     Payment transactions for orders
     """
-    PAYMENT_TYPE_CHOICES = [
-        ('cash', 'Cash'),
-        ('cheque', 'Cheque'),
-        ('online', 'Online Transfer'),
-    ]
+    class PaymentType(models.TextChoices):
+        CASH = 'cash', 'Cash'
+        CHEQUE = 'cheque', 'Cheque'
+        ONLINE = 'online', 'Online Transfer'
+    
+    PAYMENT_TYPE_CHOICES = PaymentType.choices
     
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='payments')
     payment_date = models.DateTimeField(default=timezone.now)
     amount = models.DecimalField(max_digits=10, decimal_places=2, validators=[MinValueValidator(0)])
-    payment_type = models.CharField(max_length=20, choices=PAYMENT_TYPE_CHOICES)
+    payment_type = models.CharField(max_length=20, choices=PaymentType.choices)
     reference_number = models.CharField(max_length=100, blank=True)
     notes = models.TextField(blank=True)
     
     class Meta:
         ordering = ['-payment_date']
+        indexes = [
+            models.Index(fields=['-payment_date']),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(amount__gte=0), name='payment_amount_nonneg'),
+        ]
     
     def __str__(self):
         return f"Payment {self.amount} for {self.order.order_number}"
     
     def save(self, *args, **kwargs):
+        is_new = self._state.adding
         super().save(*args, **kwargs)
         
-        # Update order paid amount
-        self.order.paid_amount = sum(p.amount for p in self.order.payments.all())
-        
-        # Update payment status
-        if self.order.paid_amount >= self.order.total_amount:
-            self.order.payment_status = 'paid'
-        elif self.order.paid_amount > 0:
-            self.order.payment_status = 'partial'
+        # Update paid amount and payment status in one UPDATE; both
+        # expressions read the pre-update row, so the status compares
+        # against the new paid amount rather than the paid_amount column
+        money = self._meta.get_field('amount')
+        if is_new:
+            paid = F('paid_amount') + self.amount
         else:
-            self.order.payment_status = 'unpaid'
+            # An edited amount can't be applied as a delta, so re-sum
+            payments_total = Payment.objects.filter(order=OuterRef('pk')).order_by().values(
+                'order'
+            ).annotate(total=Sum('amount')).values('total')
+            paid = Coalesce(Subquery(payments_total), Value(Decimal('0')), output_field=money)
+        # Round before comparing so REAL drift (0.7 + 0.1 < 0.8) can't leave
+        # a fully paid order marked partial
+        paid = Round(paid, 2, output_field=money)
+        Order.objects.filter(pk=self.order_id).update(
+            paid_amount=paid,
+            payment_status=Case(
+                When(GreaterThanOrEqual(paid, F('total_amount')), then=Value(Order.PaymentStatus.PAID)),
+                When(GreaterThan(paid, 0), then=Value(Order.PaymentStatus.PARTIAL)),
+                default=Value(Order.PaymentStatus.UNPAID),
+            ),
+        )
+        bump_data_version()
         
-        self.order.save()
+        # Keep the related instance in step with the row
+        if Payment.order.is_cached(self):
+            self.order.refresh_from_db(fields=['paid_amount', 'payment_status'])
+            self.order.__dict__.pop('balance_amount', None)
@@ -0,0 +1,19 @@
+"""
+Paginators for dashboard list views
+"""
+from django.core.paginator import Paginator
+
+__all__ = ['KnownCountPaginator']
+
+
+class KnownCountPaginator(Paginator):
+    """
+    Paginator that takes the total from the caller when it is already known,
+    skipping the COUNT(*) query Django would otherwise run
+    """
+    
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Paginator.count is a cached_property, so seed its cache
+            self.__dict__['count'] = count
@@ -0,0 +1,52 @@
+"""
+Signal handlers that keep cached dashboard data fresh
+"""
+import threading
+from contextlib import contextmanager
+
+from django.db.models.signals import post_delete, post_save
+
+from .caching import bump_data_version
+from .models import Vendor, Driver, CementProduct, Order, OrderItem, Payment
+
+TRACKED_MODELS = (Vendor, Driver, CementProduct, Order, OrderItem, Payment)
+
+_local = threading.local()
+
+
+@contextmanager
+def bulk_items():
+    """
+    Skip per-item total recalculation; the caller must run
+    order.calculate_totals() once after saving its items
+    """
+    previous = getattr(_local, 'bulk', False)
+    _local.bulk = True
+    try:
+        yield
+    finally:
+        _local.bulk = previous
+
+
+def invalidate_dashboard_cache(sender, **kwargs):
+    bump_data_version()
+
+
+for model in TRACKED_MODELS:
+    post_save.connect(invalidate_dashboard_cache, sender=model)
+    post_delete.connect(invalidate_dashboard_cache, sender=model)
+
+
+def recalculate_order_totals(sender, instance, raw=False, **kwargs):
+    if raw or getattr(_local, 'bulk', False):
+        return
+    if OrderItem.order.is_cached(instance):
+        instance.order.calculate_totals()
+    else:
+        # Deleted items may not have their order loaded; the recalculation
+        # is a single UPDATE keyed on the pk, so skip fetching the row
+        Order(pk=instance.order_id).calculate_totals(refresh=False)
+
+
+post_save.connect(recalculate_order_totals, sender=OrderItem)
+post_delete.connect(recalculate_order_totals, sender=OrderItem)
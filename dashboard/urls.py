@@ -9,7 +9,7 @@ from .views import (
     StockListView, StockUpdateView, ProductCreateView,
     PendingOrderListView, OrderStatusUpdateView,
     DailyDispatchView,
-    FinanceView,
+    FinanceView, FinanceChartView,
     AlertsView,
     SettingsView,
     SupportView,
@@ -50,6 +50,7 @@ urlpatterns = [
     
     # Finance Analytics
     path('finance/', FinanceView.as_view(), name='finance'),
+    path('finance/charts/<slug:chart>/', FinanceChartView.as_view(), name='finance_chart'),
     
     # Alerts & Notifications
     path('alerts/', AlertsView.as_view(), name='alerts'),
@@ -1,19 +1,101 @@
 """
 Dashboard views using Class-Based Views for proper OOP structure
 """
-from django.views.generic import TemplateView, CreateView, ListView, UpdateView, DeleteView
+import calendar
+import hashlib
+from functools import lru_cache
+
+from django.views.generic import View, TemplateView, CreateView, ListView, UpdateView, DeleteView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.urls import reverse_lazy
-from django.shortcuts import redirect
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.conf import settings
 from django.contrib import messages
-from django.db import transaction
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, DecimalField, F, FloatField, Prefetch, Q, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
+from django.views.decorators.cache import cache_page
+from django.views.decorators.http import etag
 from typing import Dict, Any
+from .caching import (
+    CHOICES_TIMEOUT, FINANCE_TIMEOUT, HOME_STATS_TIMEOUT, STATIC_PAGE_TIMEOUT,
+    bump_data_version, cached_options, data_version,
+)
 from .models import Order, OrderItem, Vendor, Driver, CementProduct
-from .forms import OrderForm, OrderItemFormSet
-from .forms_vendor import VendorForm
+from .forms import OrderForm, OrderItemFormSet, VendorForm
 from .forms_driver import DriverForm
-from .forms_stock import StockUpdateForm, ProductCreateForm
+from .forms_stock import AdjustmentType, StockUpdateForm, ProductCreateForm
+from .json_utils import dumps
+from .pagination import KnownCountPaginator
+
+
+STATUS_LABELS = dict(Order.Status.choices)
+
+
+def month_start(day, months_back=0):
+    """
+    First day of the calendar month `months_back` months before `day`
+    """
+    year, month = divmod(day.year * 12 + day.month - 1 - months_back, 12)
+    return day.replace(year=year, month=month + 1, day=1)
+
+
+@lru_cache(maxsize=1)
+def month_bounds(day):
+    """
+    First and last day of `day`'s month as ISO date strings
+    """
+    last_day = calendar.monthrange(day.year, day.month)[1]
+    return day.replace(day=1).isoformat(), day.replace(day=last_day).isoformat()
+
+
+def finance_date_range(params):
+    """
+    Finance report range from the query string, defaulting to the current month
+    """
+    date_from = params.get('date_from', '')
+    date_to = params.get('date_to', '')
+    if not date_from or not date_to:
+        from datetime import date
+        date_from, date_to = month_bounds(date.today())
+    return date_from, date_to
+
+
+def finance_chart_key(request, chart):
+    """
+    Cache key for a finance chart series; the day is included because the
+    monthly trend is relative to today, which is also why it ignores the range
+    """
+    from datetime import date
+    
+    key = f'dashboard:finance:{chart}:v{data_version()}:{date.today()}'
+    if chart == 'monthly':
+        return key
+    date_from, date_to = finance_date_range(request.GET)
+    return f'{key}:{date_from}:{date_to}'
+
+
+def finance_chart_etag(request, chart):
+    """
+    ETag for a finance chart response, changing whenever its cache key does
+    """
+    return hashlib.md5(finance_chart_key(request, chart).encode()).hexdigest()
+
+
+class FilterParamsMixin:
+    """
+    Read a list view's GET filters once per request
+    """
+    filter_params = ()
+    
+    @cached_property
+    def params(self):
+        return {key: self.request.GET.get(key, '') for key in self.filter_params}
 
 
 class BaseDashboardView(TemplateView):
@@ -42,47 +124,69 @@ class DashboardHomeView(BaseDashboardView):
         """
         Provide dashboard statistics and alerts
         """
+        from datetime import date
+        
+        context = super().get_context_data(**kwargs)
+        
+        # Stats are shared by all users; the key changes with the data
+        # version and the date, and the TTL bounds time-based staleness
+        cache_key = f'dashboard:home:v{data_version()}:{date.today()}'
+        context.update(cache.get_or_set(cache_key, self.get_dashboard_data, HOME_STATS_TIMEOUT))
+        return context
+    
+    def get_dashboard_data(self) -> Dict[str, Any]:
+        """
+        Compute the statistics, alerts and chart data shown on the home page
+        """
         from datetime import date, timedelta
         from django.db.models import Sum, Count, Q
+        from django.db.models.functions import TruncDate, TruncMonth
         from decimal import Decimal
         
-        context = super().get_context_data(**kwargs)
+        context = {}
         
         # Get today's date range
         today = date.today()
         yesterday = today - timedelta(days=1)
         last_month = today - timedelta(days=30)
         
-        # Calculate real statistics
-        total_orders = Order.objects.count()
-        pending_orders = Order.objects.filter(
-            status__in=['pending', 'confirmed', 'processing']
-        ).count()
-        
-        delivered_today = Order.objects.filter(
-            order_date__date=today,
-            status='delivered'
-        ).count()
+        # Calculate real statistics in one pass over orders
+        order_stats = Order.objects.aggregate(
+            total_orders=Count('id'),
+            pending_orders=Count('id', filter=Q(status__in=['pending', 'confirmed', 'processing'])),
+            delivered_today=Count('id', filter=Q(order_date__date=today, status='delivered')),
+            revenue_today=Sum('total_amount', filter=Q(order_date__date=today, status='delivered')),
+            revenue_yesterday=Sum('total_amount', filter=Q(order_date__date=yesterday, status='delivered')),
+            # Delayed orders
+            delayed_orders=Count('id', filter=Q(
+                status__in=['confirmed', 'processing', 'dispatched'],
+                delivery_date__lt=today
+            )),
+            # Orders this month vs last month
+            orders_this_month=Count('id', filter=Q(order_date__date__gte=last_month)),
+            orders_last_month=Count('id', filter=Q(
+                order_date__date__gte=today - timedelta(days=60),
+                order_date__date__lt=last_month
+            )),
+        )
+        total_orders = order_stats['total_orders']
+        pending_orders = order_stats['pending_orders']
+        delivered_today = order_stats['delivered_today']
+        delayed_orders = order_stats['delayed_orders']
+        orders_this_month = order_stats['orders_this_month']
+        orders_last_month = order_stats['orders_last_month']
         
         # Stock calculation
-        total_stock = CementProduct.objects.aggregate(
-            total=Sum('stock_quantity')
-        )['total'] or 0
-        
-        low_stock_alerts = CementProduct.objects.filter(
-            stock_quantity__lt=500  # Alert threshold
-        ).count()
+        stock_stats = CementProduct.objects.aggregate(
+            total_stock=Sum('stock_quantity'),
+            low_stock_alerts=Count('id', filter=Q(stock_quantity__lt=500)),  # Alert threshold
+        )
+        total_stock = stock_stats['total_stock'] or 0
+        low_stock_alerts = stock_stats['low_stock_alerts']
         
         # Revenue today
-        revenue_today = Order.objects.filter(
-            order_date__date=today,
-            status='delivered'
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
-        
-        revenue_yesterday = Order.objects.filter(
-            order_date__date=yesterday,
-            status='delivered'
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+        revenue_today = order_stats['revenue_today'] or Decimal('0')
+        revenue_yesterday = order_stats['revenue_yesterday'] or Decimal('0')
         
         # Revenue comparison
         if revenue_yesterday > 0:
@@ -93,21 +197,6 @@ class DashboardHomeView(BaseDashboardView):
         # Active drivers
         active_drivers = Driver.objects.filter(is_active=True).count()
         
-        # Delayed orders
-        delayed_orders = Order.objects.filter(
-            status__in=['confirmed', 'processing', 'dispatched'],
-            delivery_date__lt=today
-        ).count()
-        
-        # Orders this month vs last month
-        orders_this_month = Order.objects.filter(
-            order_date__date__gte=last_month
-        ).count()
-        orders_last_month = Order.objects.filter(
-            order_date__date__gte=today - timedelta(days=60),
-            order_date__date__lt=last_month
-        ).count()
-        
         if orders_last_month > 0:
             orders_change = ((orders_this_month - orders_last_month) / orders_last_month) * 100
         else:
@@ -130,7 +219,10 @@ class DashboardHomeView(BaseDashboardView):
         alerts = []
         
         # Low stock alerts
-        low_stock_products = CementProduct.objects.filter(stock_quantity__lt=500).order_by('stock_quantity')[:3]
+        # The count comes from the stock aggregate above; only fetch the rows shown
+        low_stock_products = CementProduct.objects.filter(stock_quantity__lt=500).only(
+            'name', 'stock_quantity'
+        ).order_by('stock_quantity')[:3]
         for product in low_stock_products:
             alerts.append({
                 'type': 'warning',
@@ -149,7 +241,9 @@ class DashboardHomeView(BaseDashboardView):
             })
         
         # Recent pending orders
-        recent_pending = Order.objects.filter(status='pending').order_by('-order_date').first()
+        recent_pending = Order.objects.filter(status='pending').only(
+            'order_number', 'order_date'
+        ).order_by('-order_date').first()
         if recent_pending:
             time_diff = (today - recent_pending.order_date.date()).days
             if time_diff == 0:
@@ -168,63 +262,70 @@ class DashboardHomeView(BaseDashboardView):
         
         context['alerts'] = alerts[:5]  # Limit to 5 alerts
         
-        # Recent deliveries - real data
+        # Recent deliveries - real data; bags come from the stored
+        # bag_count, so no per-order item query is needed
         recent_deliveries = Order.objects.filter(
             status__in=['delivered', 'dispatched']
-        ).select_related('vendor').order_by('-order_date')[:8]
+        ).select_related('vendor').only(
+            'order_number', 'status', 'bag_count', 'vendor__name'
+        ).order_by('-order_date')[:8]
         
         deliveries_list = []
         for order in recent_deliveries:
-            total_bags = sum(item.quantity for item in order.items.all())
             deliveries_list.append({
                 'order_id': order.order_number,
                 'vendor': order.vendor.name,
-                'bags': total_bags,
-                'status': order.get_status_display(),
+                'bags': order.total_bags,
+                'status': STATUS_LABELS.get(order.status, order.status),
                 'order_pk': order.pk,
             })
         
         context['recent_deliveries'] = deliveries_list
         
+        # Delivered revenue per day for the weekly chart
+        daily_totals = dict(
+            Order.objects.filter(
+                order_date__date__gte=today - timedelta(days=6),
+                status='delivered'
+            ).annotate(day=TruncDate('order_date')).values('day').annotate(
+                total=Sum('total_amount')
+            ).order_by().values_list('day', 'total')
+        )
+        
         # Weekly revenue data for chart
         weekly_revenue = []
         for i in range(6, -1, -1):
             day = today - timedelta(days=i)
-            day_revenue = Order.objects.filter(
-                order_date__date=day,
-                status='delivered'
-            ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+            day_revenue = daily_totals.get(day) or Decimal('0')
             
             weekly_revenue.append({
                 'date': day.strftime('%a'),
                 'revenue': float(day_revenue)
             })
         
-        # Monthly revenue for comparison
-        monthly_revenue = []
-        for i in range(11, -1, -1):
-            month_date = today - timedelta(days=i*30)
-            month_start = date(month_date.year, month_date.month, 1)
-            if month_date.month == 12:
-                month_end = date(month_date.year, 12, 31)
-            else:
-                month_end = date(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-            
-            month_rev = Order.objects.filter(
-                order_date__date__gte=month_start,
-                order_date__date__lte=month_end,
+        # Monthly revenue for the last 12 calendar months in one GROUP BY
+        month_starts = [month_start(today, months_back=i) for i in range(11, -1, -1)]
+        monthly_totals = dict(
+            Order.objects.filter(
+                order_date__date__gte=month_starts[0],
                 status='delivered'
-            ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+            ).annotate(month=TruncMonth('order_date', output_field=DateField())).values('month').annotate(
+                total=Sum('total_amount')
+            ).order_by().values_list('month', 'total')
+        )
+        
+        monthly_revenue = []
+        for start in month_starts:
+            month_rev = monthly_totals.get(start) or Decimal('0')
             
             monthly_revenue.append({
-                'month': month_start.strftime('%b'),
+                'month': start.strftime('%b'),
                 'revenue': float(month_rev)
             })
         
         # Convert to JSON for JavaScript
-        import json
-        context['weekly_revenue_json'] = json.dumps(weekly_revenue)
-        context['monthly_revenue_json'] = json.dumps(monthly_revenue)
+        context['weekly_revenue_json'] = dumps(weekly_revenue)
+        context['monthly_revenue_json'] = dumps(monthly_revenue)
         
         return context
 
@@ -247,26 +348,28 @@ class OrderCreateView(BaseDashboardView):
         else:
             context['form'] = OrderForm()
         
-        # Get all vendors, drivers, and products for dropdowns
-        context['vendors'] = Vendor.objects.filter(is_active=True)
-        context['drivers'] = Driver.objects.filter(is_active=True)
-        
-        # Get products and format for JavaScript
-        products = CementProduct.objects.filter(is_active=True)
-        context['products'] = products
-        
-        # Format products for JSON
-        import json
-        products_json = []
-        for p in products:
-            products_json.append({
-                'id': p.id,
-                'name': p.name,
-                'grade': p.grade,
-                'price': float(p.price_per_bag),
-                'stock': p.stock_quantity
-            })
-        context['products_json'] = json.dumps(products_json)
+        # Dropdown rows carry only the columns the options render, and are
+        # cached until a vendor or driver changes
+        context['vendors'] = cached_options('order_vendors', Vendor.objects.filter(is_active=True).values(
+            'id', 'name', 'company_name', 'phone', 'address', 'city', 'state', 'pincode',
+            available_credit=F('credit_limit') - F('outstanding_balance'),
+        ))
+        context['drivers'] = cached_options('order_drivers', Driver.objects.filter(is_active=True).values(
+            'id', 'name', 'vehicle_number', 'vehicle_capacity',
+        ))
+        
+        # Products for the JavaScript item rows, shaped by the query itself and
+        # encoded once per data version rather than on every render
+        products = CementProduct.objects.filter(is_active=True).values(
+            'id', 'name', 'grade',
+            price=Cast('price_per_bag', FloatField()),
+            stock=F('stock_quantity'),
+        )
+        context['products_json'] = cache.get_or_set(
+            f'dashboard:products_json:v{data_version()}',
+            lambda: dumps(list(products)),
+            CHOICES_TIMEOUT
+        )
         
         return context
     
@@ -306,18 +409,24 @@ class OrderCreateView(BaseDashboardView):
                     status='pending'
                 )
                 
-                # Create order items
+                # Create order items in one INSERT; bulk_create skips
+                # OrderItem.save(), so line totals are computed here
+                items = []
                 for product_id, quantity, price in zip(products, quantities, prices):
                     if product_id and quantity and price:
-                        OrderItem.objects.create(
+                        unit_price = Decimal(str(price))
+                        items.append(OrderItem(
                             order=order,
                             product_id=product_id,
                             quantity=int(quantity),
-                            unit_price=Decimal(str(price))
-                        )
+                            unit_price=unit_price,
+                            total_price=int(quantity) * unit_price
+                        ))
+                OrderItem.objects.bulk_create(items, batch_size=settings.BULK_CREATE_BATCH_SIZE)
                 
-                # Calculate totals
-                order.calculate_totals()
+                # Calculate totals once for all items in a single UPDATE;
+                # only the order number is needed afterwards
+                order.calculate_totals(refresh=False)
                 
                 messages.success(request, f'Order {order.order_number} created successfully!')
                 return redirect('dashboard:home')
@@ -374,8 +483,16 @@ class VendorListView(ListView):
         # Add vendor-specific context
         context['search_query'] = self.request.GET.get('search', '')
         context['status_filter'] = self.request.GET.get('status', '')
-        context['total_vendors'] = Vendor.objects.count()
-        context['active_vendors'] = Vendor.objects.filter(is_active=True).count()
+        counts = cache.get_or_set(
+            f'dashboard:vendor_counts:v{data_version()}',
+            lambda: Vendor.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(is_active=True)),
+            ),
+            CHOICES_TIMEOUT
+        )
+        context['total_vendors'] = counts['total']
+        context['active_vendors'] = counts['active']
         return context
 
 
@@ -435,11 +552,19 @@ class VendorDeleteView(DeleteView):
     success_url = reverse_lazy('dashboard:vendor_list')
     
     def delete(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.is_active = False
-        self.object.save()
-        messages.success(request, f'Vendor "{self.object.name}" deactivated successfully!')
+        vendors = Vendor.objects.filter(pk=kwargs['pk'])
+        name = vendors.values_list('name', flat=True).first()
+        if name is None:
+            raise Http404
+        vendors.update(is_active=False, updated_at=timezone.now())
+        # update() bypasses post_save, so invalidate cached pages here
+        bump_data_version()
+        messages.success(request, f'Vendor "{name}" deactivated successfully!')
         return redirect(self.success_url)
+    
+    def post(self, request, *args, **kwargs):
+        # DeleteView.post() would hard-delete through form_valid()
+        return self.delete(request, *args, **kwargs)
 
 
 # ========================================
@@ -495,13 +620,50 @@ class DriverListView(ListView):
         context['search_query'] = self.request.GET.get('search', '')
         context['status_filter'] = self.request.GET.get('status', '')
         context['vehicle_filter'] = self.request.GET.get('vehicle_type', '')
-        context['total_drivers'] = Driver.objects.count()
-        context['active_drivers'] = Driver.objects.filter(is_active=True).count()
-        context['vehicle_types'] = Driver.objects.values_list('vehicle_type', flat=True).distinct()
+        counts = cache.get_or_set(
+            f'dashboard:driver_counts:v{data_version()}',
+            lambda: Driver.objects.aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(is_active=True)),
+            ),
+            CHOICES_TIMEOUT
+        )
+        context['total_drivers'] = counts['total']
+        context['active_drivers'] = counts['active']
+        # Ordering by vehicle_type keeps Meta.ordering's name column out of
+        # the SELECT DISTINCT, which would otherwise repeat each type
+        context['vehicle_types'] = cache.get_or_set(
+            f'dashboard:vehicle_types:v{data_version()}',
+            lambda: list(Driver.objects.values_list('vehicle_type', flat=True).order_by('vehicle_type').distinct()),
+            CHOICES_TIMEOUT
+        )
         return context
 
 
-class DriverCreateView(CreateView):
+class DriverFormMixin:
+    """
+    Save a driver form, reporting a duplicate license number as a form error
+    """
+    success_verb = 'saved'
+    
+    def form_valid(self, form):
+        # license_number is unique in the DB; a concurrent insert can still
+        # slip past validate_unique, so surface the constraint as a form error
+        try:
+            with transaction.atomic():
+                response = super().form_valid(form)
+        except IntegrityError:
+            form.add_error('license_number', 'Driver with this License number already exists.')
+            return self.form_invalid(form)
+        messages.success(self.request, f'Driver "{form.instance.name}" {self.success_verb} successfully!')
+        return response
+    
+    def form_invalid(self, form):
+        messages.error(self.request, 'Please correct the errors below.')
+        return super().form_invalid(form)
+
+
+class DriverCreateView(DriverFormMixin, CreateView):
     """
     Create a new driver
     """
@@ -509,23 +671,16 @@ class DriverCreateView(CreateView):
     form_class = DriverForm
     template_name = 'dashboard/driver_form.html'
     success_url = reverse_lazy('dashboard:driver_list')
+    success_verb = 'created'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
         return context
-    
-    def form_valid(self, form):
-        messages.success(self.request, f'Driver "{form.instance.name}" created successfully!')
-        return super().form_valid(form)
-    
-    def form_invalid(self, form):
-        messages.error(self.request, 'Please correct the errors below.')
-        return super().form_invalid(form)
 
 
-class DriverUpdateView(UpdateView):
+class DriverUpdateView(DriverFormMixin, UpdateView):
     """
     Update existing driver
     """
@@ -533,20 +688,13 @@ class DriverUpdateView(UpdateView):
     form_class = DriverForm
     template_name = 'dashboard/driver_form.html'
     success_url = reverse_lazy('dashboard:driver_list')
+    success_verb = 'updated'
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
         return context
-    
-    def form_valid(self, form):
-        messages.success(self.request, f'Driver "{form.instance.name}" updated successfully!')
-        return super().form_valid(form)
-    
-    def form_invalid(self, form):
-        messages.error(self.request, 'Please correct the errors below.')
-        return super().form_invalid(form)
 
 
 class DriverDeleteView(DeleteView):
@@ -557,17 +705,31 @@ class DriverDeleteView(DeleteView):
     success_url = reverse_lazy('dashboard:driver_list')
     
     def delete(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        self.object.is_active = False
-        self.object.save()
-        messages.success(request, f'Driver "{self.object.name}" marked as unavailable!')
+        drivers = Driver.objects.filter(pk=kwargs['pk'])
+        name = drivers.values_list('name', flat=True).first()
+        if name is None:
+            raise Http404
+        drivers.update(is_active=False, updated_at=timezone.now())
+        # update() bypasses post_save, so invalidate cached pages here
+        bump_data_version()
+        messages.success(request, f'Driver "{name}" marked as unavailable!')
         return redirect(self.success_url)
+    
+    def post(self, request, *args, **kwargs):
+        # DeleteView.post() would hard-delete through form_valid()
+        return self.delete(request, *args, **kwargs)
 
 
 # ========================================
 # Stock/Inventory Views
 # ========================================
 
+# Columns rendered by stock_list.html; timestamps and flags are never shown
+STOCK_LIST_FIELDS = (
+    'id', 'name', 'grade', 'weight_per_bag', 'price_per_bag', 'stock_quantity', 'reorder_level',
+)
+
+
 class StockListView(ListView):
     """
     Display warehouse stock/inventory with statistics
@@ -581,7 +743,7 @@ class StockListView(ListView):
         """
         Filter products based on search and stock status
         """
-        queryset = CementProduct.objects.all().order_by('grade', 'name')
+        queryset = CementProduct.objects.only(*STOCK_LIST_FIELDS).order_by('grade', 'name')
         
         # Search functionality
         search_query = self.request.GET.get('search', '')
@@ -600,7 +762,7 @@ class StockListView(ListView):
         stock_filter = self.request.GET.get('stock_status', '')
         if stock_filter == 'low':
             # Products with stock at or below reorder level
-            queryset = [p for p in queryset if p.is_low_stock]
+            queryset = queryset.filter(stock_quantity__lte=F('reorder_level'))
         elif stock_filter == 'out':
             queryset = queryset.filter(stock_quantity=0)
         elif stock_filter == 'available':
@@ -614,20 +776,21 @@ class StockListView(ListView):
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
         
-        # Calculate warehouse statistics
-        all_products = CementProduct.objects.all()
-        
-        total_bags = sum(p.stock_quantity for p in all_products)
-        total_value = sum(float(p.stock_value) for p in all_products)
-        low_stock_count = sum(1 for p in all_products if p.is_low_stock and p.stock_quantity > 0)
-        out_of_stock_count = all_products.filter(stock_quantity=0).count()
+        # Calculate warehouse statistics in a single aggregate
+        stats = CementProduct.objects.aggregate(
+            total_products=Count('id'),
+            total_bags=Sum('stock_quantity'),
+            total_value=Sum(F('stock_quantity') * F('price_per_bag'), output_field=DecimalField()),
+            low_stock_count=Count('id', filter=Q(stock_quantity__gt=0, stock_quantity__lte=F('reorder_level'))),
+            out_of_stock_count=Count('id', filter=Q(stock_quantity=0)),
+        )
         
         context['warehouse_stats'] = {
-            'total_products': all_products.count(),
-            'total_bags': total_bags,
-            'total_value': total_value,
-            'low_stock_count': low_stock_count,
-            'out_of_stock_count': out_of_stock_count,
+            'total_products': stats['total_products'],
+            'total_bags': stats['total_bags'] or 0,
+            'total_value': float(stats['total_value'] or 0),
+            'low_stock_count': stats['low_stock_count'],
+            'out_of_stock_count': stats['out_of_stock_count'],
         }
         
         # Add filter context
@@ -657,31 +820,52 @@ class StockUpdateView(UpdateView):
     
     def form_valid(self, form):
         # Get adjustment details
-        adjustment_type = self.request.POST.get('adjustment_type')
-        adjustment_quantity = int(self.request.POST.get('adjustment_quantity', 0))
+        adjustment_type = form.cleaned_data['adjustment_type']
+        adjustment_quantity = form.cleaned_data['adjustment_quantity']
+        old_stock = self.object.stock_quantity
+        product = CementProduct.objects.filter(pk=self.object.pk)
+        
+        with transaction.atomic():
+            # Apply the adjustment as a single UPDATE so concurrent changes are not lost
+            if adjustment_type == AdjustmentType.ADD:
+                product.update(stock_quantity=F('stock_quantity') + adjustment_quantity)
+            elif adjustment_type == AdjustmentType.REMOVE:
+                updated = product.filter(stock_quantity__gte=adjustment_quantity).update(
+                    stock_quantity=F('stock_quantity') - adjustment_quantity
+                )
+                if not updated:
+                    form.add_error(
+                        'adjustment_quantity',
+                        f'Insufficient stock. Available: {product.values_list("stock_quantity", flat=True).get()} bags'
+                    )
+                    return self.form_invalid(form)
+            elif adjustment_type == AdjustmentType.SET:
+                product.update(stock_quantity=adjustment_quantity)
+            
+            # Save the editable product fields without touching stock_quantity
+            self.object = form.save(commit=False)
+            self.object.save(update_fields=[*form._meta.fields, 'updated_at'])
         
-        # Update stock based on adjustment type
-        if adjustment_type == 'add':
-            form.instance.stock_quantity += adjustment_quantity
+        self.object.refresh_from_db(fields=['stock_quantity'])
+        new_stock = self.object.stock_quantity
+        
+        if adjustment_type == AdjustmentType.ADD:
             messages.success(
                 self.request,
-                f'Added {adjustment_quantity} bags. New stock: {form.instance.stock_quantity} bags'
+                f'Added {adjustment_quantity} bags. New stock: {new_stock} bags'
             )
-        elif adjustment_type == 'remove':
-            form.instance.stock_quantity -= adjustment_quantity
+        elif adjustment_type == AdjustmentType.REMOVE:
             messages.success(
                 self.request,
-                f'Removed {adjustment_quantity} bags. New stock: {form.instance.stock_quantity} bags'
+                f'Removed {adjustment_quantity} bags. New stock: {new_stock} bags'
             )
-        elif adjustment_type == 'set':
-            old_stock = self.object.stock_quantity
-            form.instance.stock_quantity = adjustment_quantity
+        elif adjustment_type == AdjustmentType.SET:
             messages.success(
                 self.request,
                 f'Stock updated from {old_stock} to {adjustment_quantity} bags'
             )
         
-        return super().form_valid(form)
+        return redirect(self.get_success_url())
     
     def form_invalid(self, form):
         messages.error(self.request, 'Please correct the errors below.')
@@ -723,7 +907,14 @@ class ProductCreateView(CreateView):
 # Pending Orders Views
 # ========================================
 
-class PendingOrderListView(ListView):
+PENDING_LIST_FIELDS = (
+    'id', 'order_number', 'order_date', 'delivery_date', 'delivery_address',
+    'subtotal', 'discount_amount', 'total_amount', 'paid_amount', 'status', 'payment_status',
+    'vendor__name', 'vendor__company_name', 'vendor__phone', 'driver__name',
+)
+
+
+class PendingOrderListView(FilterParamsMixin, ListView):
     """
     Display pending/active orders (not delivered or cancelled)
     """
@@ -731,17 +922,29 @@ class PendingOrderListView(ListView):
     template_name = 'dashboard/pending_orders.html'
     context_object_name = 'orders'
     paginate_by = 15
+    filter_params = ('search', 'status', 'payment_status', 'date_from', 'date_to')
+    
+    def get_base_queryset(self):
+        """
+        Orders still in progress, shared by the list and its statistics
+        """
+        return Order.objects.filter(
+            status__in=['pending', 'confirmed', 'processing', 'dispatched']
+        )
     
     def get_queryset(self):
         """
         Filter orders by status - show pending, confirmed, processing, dispatched
         """
-        queryset = Order.objects.select_related('vendor', 'driver').prefetch_related('items').filter(
-            status__in=['pending', 'confirmed', 'processing', 'dispatched']
+        params = self.params
+        queryset = self.get_base_queryset().select_related('vendor', 'driver').only(
+            *PENDING_LIST_FIELDS
+        ).annotate(
+            item_count=Count('items')
         ).order_by('-order_date')
         
         # Search functionality
-        search_query = self.request.GET.get('search', '')
+        search_query = params['search']
         if search_query:
             queryset = queryset.filter(
                 Q(order_number__icontains=search_query) |
@@ -751,51 +954,59 @@ class PendingOrderListView(ListView):
             )
         
         # Filter by status
-        status_filter = self.request.GET.get('status', '')
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
+        if params['status']:
+            queryset = queryset.filter(status=params['status'])
         
         # Filter by payment status
-        payment_filter = self.request.GET.get('payment_status', '')
-        if payment_filter:
-            queryset = queryset.filter(payment_status=payment_filter)
+        if params['payment_status']:
+            queryset = queryset.filter(payment_status=params['payment_status'])
         
         # Filter by date range
-        date_from = self.request.GET.get('date_from', '')
-        date_to = self.request.GET.get('date_to', '')
-        if date_from:
-            queryset = queryset.filter(order_date__gte=date_from)
-        if date_to:
-            queryset = queryset.filter(order_date__lte=date_to)
+        if params['date_from']:
+            queryset = queryset.filter(order_date__gte=params['date_from'])
+        if params['date_to']:
+            queryset = queryset.filter(order_date__lte=params['date_to'])
         
         return queryset
     
+    @cached_property
+    def order_stats(self):
+        """
+        Statistics for all pending orders in one aggregate
+        """
+        stats = self.get_base_queryset().aggregate(
+            total_pending=Count('id'),
+            pending_count=Count('id', filter=Q(status='pending')),
+            confirmed_count=Count('id', filter=Q(status='confirmed')),
+            processing_count=Count('id', filter=Q(status='processing')),
+            dispatched_count=Count('id', filter=Q(status='dispatched')),
+            total_value=Sum('total_amount'),
+        )
+        stats['total_value'] = float(stats['total_value'] or 0)
+        return stats
+    
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        # Unfiltered lists hold exactly the orders counted in the stats
+        if not any(self.params.values()):
+            kwargs['count'] = self.order_stats['total_pending']
+        return KnownCountPaginator(
+            queryset, per_page, orphans=orphans, allow_empty_first_page=allow_empty_first_page, **kwargs
+        )
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Add common context
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
-        
-        # Calculate statistics for pending orders
-        all_pending = Order.objects.filter(
-            status__in=['pending', 'confirmed', 'processing', 'dispatched']
-        )
-        
-        context['order_stats'] = {
-            'total_pending': all_pending.count(),
-            'pending_count': all_pending.filter(status='pending').count(),
-            'confirmed_count': all_pending.filter(status='confirmed').count(),
-            'processing_count': all_pending.filter(status='processing').count(),
-            'dispatched_count': all_pending.filter(status='dispatched').count(),
-            'total_value': sum(float(o.total_amount) for o in all_pending),
-        }
+        context['order_stats'] = self.order_stats
         
         # Add filter context
-        context['search_query'] = self.request.GET.get('search', '')
-        context['status_filter'] = self.request.GET.get('status', '')
-        context['payment_filter'] = self.request.GET.get('payment_status', '')
-        context['date_from'] = self.request.GET.get('date_from', '')
-        context['date_to'] = self.request.GET.get('date_to', '')
+        params = self.params
+        context['search_query'] = params['search']
+        context['status_filter'] = params['status']
+        context['payment_filter'] = params['payment_status']
+        context['date_from'] = params['date_from']
+        context['date_to'] = params['date_to']
         context['status_choices'] = [
             ('pending', 'Pending'),
             ('confirmed', 'Confirmed'),
@@ -816,7 +1027,8 @@ class OrderStatusUpdateView(UpdateView):
     success_url = reverse_lazy('dashboard:pending_orders')
     
     def form_valid(self, form):
-        old_status = Order.objects.get(pk=self.object.pk).status
+        # The form has already applied the new status to self.object
+        old_status = form.initial['status']
         new_status = form.cleaned_data['status']
         
         messages.success(
@@ -835,7 +1047,14 @@ class OrderDetailView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         order_id = kwargs.get('pk')
-        order = Order.objects.select_related('vendor', 'driver').prefetch_related('items__product').get(pk=order_id)
+        order = get_object_or_404(
+            Order.objects.select_related('vendor', 'driver').prefetch_related(
+                Prefetch('items', queryset=OrderItem.objects.select_related('product').only(
+                    'order_id', 'quantity', 'unit_price', 'total_price', 'product__name', 'product__grade'
+                ))
+            ),
+            pk=order_id
+        )
         
         context['order'] = order
         context['app_name'] = 'CemERP'
@@ -848,7 +1067,7 @@ class OrderDetailView(TemplateView):
 # Daily Dispatch Views
 # ========================================
 
-class DailyDispatchView(ListView):
+class DailyDispatchView(FilterParamsMixin, ListView):
     """
     Display daily dispatch/delivery tracking for supply chain management
     """
@@ -856,28 +1075,37 @@ class DailyDispatchView(ListView):
     template_name = 'dashboard/daily_dispatch.html'
     context_object_name = 'orders'
     paginate_by = 20
+    filter_params = ('date', 'search', 'status', 'driver')
     
-    def get_queryset(self):
+    @cached_property
+    def selected_date(self):
         """
-        Filter orders by dispatch/delivery status
+        Date from the query string, defaulting to today
         """
-        from datetime import date, timedelta
+        from datetime import date, datetime
         
-        queryset = Order.objects.select_related('vendor', 'driver').prefetch_related('items').filter(
+        if self.params['date']:
+            return datetime.strptime(self.params['date'], '%Y-%m-%d').date()
+        return date.today()
+    
+    def get_base_queryset(self):
+        """
+        Dispatched and delivered orders for the selected date
+        """
+        return Order.objects.filter(
+            order_date__date=self.selected_date,
             status__in=['dispatched', 'delivered']
-        ).order_by('-order_date')
-        
-        # Date filter - default to today
-        selected_date = self.request.GET.get('date', '')
-        if selected_date:
-            queryset = queryset.filter(order_date__date=selected_date)
-        else:
-            # Default to today's dispatches
-            today = date.today()
-            queryset = queryset.filter(order_date__date=today)
+        )
+    
+    def get_queryset(self):
+        """
+        Filter orders by dispatch/delivery status
+        """
+        params = self.params
+        queryset = self.get_base_queryset().with_related().order_by('-order_date')
         
         # Search functionality
-        search_query = self.request.GET.get('search', '')
+        search_query = params['search']
         if search_query:
             queryset = queryset.filter(
                 Q(order_number__icontains=search_query) |
@@ -887,14 +1115,12 @@ class DailyDispatchView(ListView):
             )
         
         # Filter by status (dispatched or delivered)
-        status_filter = self.request.GET.get('status', '')
-        if status_filter:
-            queryset = queryset.filter(status=status_filter)
+        if params['status']:
+            queryset = queryset.filter(status=params['status'])
         
         # Filter by driver
-        driver_filter = self.request.GET.get('driver', '')
-        if driver_filter:
-            queryset = queryset.filter(driver_id=driver_filter)
+        if params['driver']:
+            queryset = queryset.filter(driver_id=params['driver'])
         
         return queryset
     
@@ -906,40 +1132,27 @@ class DailyDispatchView(ListView):
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
         
-        # Get selected date or default to today
-        selected_date_str = self.request.GET.get('date', '')
-        if selected_date_str:
-            from datetime import datetime
-            selected_date = datetime.strptime(selected_date_str, '%Y-%m-%d').date()
-        else:
-            selected_date = date.today()
-        
+        selected_date = self.selected_date
         context['selected_date'] = selected_date
         
         # Calculate dispatch statistics for selected date
-        daily_orders = Order.objects.filter(
-            order_date__date=selected_date,
-            status__in=['dispatched', 'delivered']
+        stats = self.get_base_queryset().aggregate(
+            total_dispatches=Count('id'),
+            dispatched_count=Count('id', filter=Q(status='dispatched')),
+            delivered_count=Count('id', filter=Q(status='delivered')),
+            total_bags=Sum('bag_count'),
+            total_value=Sum('total_amount'),
+            active_drivers=Count('driver', distinct=True),
         )
-        
-        total_bags = 0
-        for order in daily_orders:
-            for item in order.items.all():
-                total_bags += item.quantity
-        
-        context['dispatch_stats'] = {
-            'total_dispatches': daily_orders.count(),
-            'dispatched_count': daily_orders.filter(status='dispatched').count(),
-            'delivered_count': daily_orders.filter(status='delivered').count(),
-            'total_bags': total_bags,
-            'total_value': sum(float(o.total_amount) for o in daily_orders),
-            'active_drivers': daily_orders.values('driver').distinct().count(),
-        }
+        stats['total_bags'] = stats['total_bags'] or 0
+        stats['total_value'] = float(stats['total_value'] or 0)
+        context['dispatch_stats'] = stats
         
         # Add filter context
-        context['search_query'] = self.request.GET.get('search', '')
-        context['status_filter'] = self.request.GET.get('status', '')
-        context['driver_filter'] = self.request.GET.get('driver', '')
+        params = self.params
+        context['search_query'] = params['search']
+        context['status_filter'] = params['status']
+        context['driver_filter'] = params['driver']
         context['all_drivers'] = Driver.objects.filter(is_active=True)
         
         # Quick date navigation
@@ -961,57 +1174,60 @@ class FinanceView(TemplateView):
     template_name = 'dashboard/finance.html'
     
     def get_context_data(self, **kwargs):
-        from datetime import date, timedelta
-        from django.db.models import Sum, Count, Avg
-        from decimal import Decimal
-        
         context = super().get_context_data(**kwargs)
         context['app_name'] = 'CemERP'
         context['company_name'] = 'Cement Industry Management'
         
-        # Date range filters
-        date_from = self.request.GET.get('date_from', '')
-        date_to = self.request.GET.get('date_to', '')
-        
-        # Default to current month if no dates provided
-        if not date_from or not date_to:
-            today = date.today()
-            date_from = date(today.year, today.month, 1).strftime('%Y-%m-%d')
-            # Last day of current month
-            if today.month == 12:
-                date_to = date(today.year, 12, 31).strftime('%Y-%m-%d')
-            else:
-                date_to = date(today.year, today.month + 1, 1) - timedelta(days=1)
-                date_to = date_to.strftime('%Y-%m-%d')
-        
+        date_from, date_to = finance_date_range(self.request.GET)
         context['date_from'] = date_from
         context['date_to'] = date_to
         
+        # Results are reused until any order changes; revenue charts are
+        # fetched separately from FinanceChartView once the page has loaded
+        context.update(cache.get_or_set(
+            f'dashboard:finance:v{data_version()}:{date_from}:{date_to}',
+            lambda: self.get_finance_data(date_from, date_to),
+            FINANCE_TIMEOUT
+        ))
+        return context
+    
+    def get_finance_data(self, date_from, date_to):
+        """
+        Compute finance KPIs, rankings and breakdowns for a date range
+        """
+        from django.db.models import Sum, Count
+        from decimal import Decimal
+        
+        data = {}
+        
         # Filter orders by date range
-        orders = Order.objects.filter(
+        orders = Order.objects.unordered().filter(
             order_date__date__gte=date_from,
             order_date__date__lte=date_to
         )
         
         # Calculate key financial metrics
-        total_revenue = orders.filter(status='delivered').aggregate(
-            total=Sum('total_amount')
-        )['total'] or Decimal('0')
-        
-        total_orders = orders.count()
-        delivered_orders = orders.filter(status='delivered').count()
-        pending_revenue = orders.filter(
-            status__in=['pending', 'confirmed', 'processing', 'dispatched']
-        ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
+        # Status and payment breakdowns ride along as filtered aggregates, so
+        # the whole summary is a single scan of the period's orders
+        breakdowns = {}
+        for status_code, _ in Order.STATUS_CHOICES:
+            breakdowns[f'status_{status_code}'] = Count('id', filter=Q(status=status_code))
+        for status_code, _ in Order.PAYMENT_STATUS_CHOICES:
+            paid_filter = Q(payment_status=status_code)
+            breakdowns[f'payment_{status_code}'] = Count('id', filter=paid_filter)
+            breakdowns[f'payment_{status_code}_amount'] = Sum('total_amount', filter=paid_filter)
+        summary = Order.objects.finance_summary(date_from, date_to, **breakdowns)
+        total_revenue = summary['delivered_revenue'] or Decimal('0')
+        total_orders = summary['orders']
+        delivered_orders = summary['delivered_orders']
+        pending_revenue = summary['pending_revenue'] or Decimal('0')
         
         # Payment analytics
-        total_paid = orders.aggregate(total=Sum('paid_amount'))['total'] or Decimal('0')
+        total_paid = summary['collected'] or Decimal('0')
         outstanding = float(total_revenue) - float(total_paid)
         
         # Average order value
-        avg_order_value = orders.filter(status='delivered').aggregate(
-            avg=Avg('total_amount')
-        )['avg'] or Decimal('0')
+        avg_order_value = summary['avg_delivered'] or Decimal('0')
         
         # Top products by revenue
         from django.db.models import F
@@ -1036,31 +1252,10 @@ class FinanceView(TemplateView):
             total_revenue=Sum('total_amount')
         ).order_by('-total_revenue')[:5]
         
-        # Monthly revenue trend (last 6 months)
-        monthly_data = []
-        for i in range(5, -1, -1):
-            month_date = date.today() - timedelta(days=i*30)
-            month_start = date(month_date.year, month_date.month, 1)
-            if month_date.month == 12:
-                month_end = date(month_date.year, 12, 31)
-            else:
-                month_end = date(month_date.year, month_date.month + 1, 1) - timedelta(days=1)
-            
-            month_revenue = Order.objects.filter(
-                order_date__date__gte=month_start,
-                order_date__date__lte=month_end,
-                status='delivered'
-            ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
-            
-            monthly_data.append({
-                'month': month_start.strftime('%b %Y'),
-                'revenue': float(month_revenue)
-            })
-        
-        # Order status breakdown
+        # Order status breakdown, listed in choice order
         status_breakdown = []
         for status_code, status_label in Order.STATUS_CHOICES:
-            count = orders.filter(status=status_code).count()
+            count = summary[f'status_{status_code}']
             if count > 0:
                 status_breakdown.append({
                     'status': status_label,
@@ -1070,10 +1265,8 @@ class FinanceView(TemplateView):
         # Payment status breakdown
         payment_breakdown = []
         for status_code, status_label in Order.PAYMENT_STATUS_CHOICES:
-            count = orders.filter(payment_status=status_code).count()
-            amount = orders.filter(payment_status=status_code).aggregate(
-                total=Sum('total_amount')
-            )['total'] or Decimal('0')
+            count = summary[f'payment_{status_code}']
+            amount = summary[f'payment_{status_code}_amount'] or Decimal('0')
             if count > 0:
                 payment_breakdown.append({
                     'status': status_label,
@@ -1081,27 +1274,8 @@ class FinanceView(TemplateView):
                     'amount': float(amount)
                 })
         
-        # Daily revenue trend for selected period
-        from datetime import datetime
-        start_date = datetime.strptime(date_from, '%Y-%m-%d').date()
-        end_date = datetime.strptime(date_to, '%Y-%m-%d').date()
-        daily_revenue = []
-        
-        current_date = start_date
-        while current_date <= end_date:
-            day_revenue = Order.objects.filter(
-                order_date__date=current_date,
-                status='delivered'
-            ).aggregate(total=Sum('total_amount'))['total'] or Decimal('0')
-            
-            daily_revenue.append({
-                'date': current_date.strftime('%Y-%m-%d'),
-                'revenue': float(day_revenue)
-            })
-            current_date += timedelta(days=1)
-        
         # Compile all data
-        context['finance_data'] = {
+        data['finance_data'] = {
             'total_revenue': float(total_revenue),
             'total_orders': total_orders,
             'delivered_orders': delivered_orders,
@@ -1112,77 +1286,152 @@ class FinanceView(TemplateView):
             'collection_rate': (float(total_paid) / float(total_revenue) * 100) if total_revenue > 0 else 0,
         }
         
-        context['top_products'] = top_products
-        context['top_vendors'] = top_vendors
-        context['monthly_data'] = monthly_data
-        context['status_breakdown'] = status_breakdown
-        context['payment_breakdown'] = payment_breakdown
-        context['daily_revenue'] = daily_revenue
+        data['top_products'] = list(top_products)
+        data['top_vendors'] = list(top_vendors)
+        data['payment_breakdown'] = payment_breakdown
         
-        # Convert to JSON for JavaScript charts
-        import json
-        context['monthly_data_json'] = json.dumps(monthly_data)
-        context['status_breakdown_json'] = json.dumps(status_breakdown)
-        context['payment_breakdown_json'] = json.dumps(payment_breakdown)
-        context['daily_revenue_json'] = json.dumps(daily_revenue)
+        # Breakdown charts come from the summary scan, so they stay inline
+        data['status_breakdown_json'] = dumps(status_breakdown)
+        data['payment_breakdown_json'] = dumps(payment_breakdown)
         
-        return context
+        return data
+
+
+class FinanceChartView(View):
+    """
+    Revenue chart series for the finance page as JSON, fetched after the page
+    has rendered so the KPIs are not held up by the trend queries
+    """
+    charts = ('monthly', 'daily')
+    
+    @method_decorator(etag(finance_chart_etag))
+    def get(self, request, chart):
+        if chart not in self.charts:
+            raise Http404(f'Unknown chart: {chart}')
+        
+        date_from, date_to = finance_date_range(request.GET)
+        series = getattr(self, f'{chart}_series')
+        payload = cache.get_or_set(
+            finance_chart_key(request, chart),
+            lambda: dumps(series(date_from, date_to)),
+            FINANCE_TIMEOUT
+        )
+        return HttpResponse(payload, content_type='application/json')
+    
+    def monthly_series(self, date_from, date_to):
+        """
+        Delivered revenue for the last 6 calendar months
+        """
+        from datetime import date
+        from django.db.models.functions import TruncMonth
+        from decimal import Decimal
+        
+        today = date.today()
+        month_starts = [month_start(today, months_back=i) for i in range(5, -1, -1)]
+        
+        monthly_totals = dict(
+            Order.objects.unordered().filter(
+                order_date__date__gte=month_starts[0],
+                status='delivered'
+            ).annotate(month=TruncMonth('order_date', output_field=DateField())).values('month').annotate(
+                total=Sum('total_amount')
+            ).values_list('month', 'total')
+        )
+        
+        monthly_data = []
+        for start in month_starts:
+            month_revenue = monthly_totals.get(start) or Decimal('0')
+            
+            monthly_data.append({
+                'month': start.strftime('%b %Y'),
+                'revenue': float(month_revenue)
+            })
+        
+        return monthly_data
+    
+    def daily_series(self, date_from, date_to):
+        """
+        Delivered revenue for each day of the selected period
+        """
+        from datetime import datetime, timedelta
+        from django.db.models.functions import TruncDate
+        from decimal import Decimal
+        
+        start_date = datetime.strptime(date_from, '%Y-%m-%d').date()
+        end_date = datetime.strptime(date_to, '%Y-%m-%d').date()
+        daily_totals = dict(
+            Order.objects.unordered().filter(
+                order_date__date__gte=start_date,
+                order_date__date__lte=end_date,
+                status='delivered'
+            ).annotate(day=TruncDate('order_date')).values('day').annotate(
+                total=Sum('total_amount')
+            ).values_list('day', 'total')
+        )
+        daily_revenue = []
+        
+        current_date = start_date
+        while current_date <= end_date:
+            day_revenue = daily_totals.get(current_date) or Decimal('0')
+            
+            daily_revenue.append({
+                'date': current_date.strftime('%Y-%m-%d'),
+                'revenue': float(day_revenue)
+            })
+            current_date += timedelta(days=1)
+        
+        return daily_revenue
+
+
+# ========================================
+# Static Pages
+# ========================================
+
+class StaticPageView(TemplateView):
+    """
+    Page with no per-request data, served from the cache
+    """
+    extra_context = {
+        'app_name': 'CemERP',
+        'company_name': 'Cement Industry Management',
+    }
+    cache_timeout = STATIC_PAGE_TIMEOUT
+    
+    def dispatch(self, request, *args, **kwargs):
+        # base.html renders flash messages, which must not end up in the cache
+        if len(messages.get_messages(request)):
+            return super().dispatch(request, *args, **kwargs)
+        return cache_page(self.cache_timeout)(super().dispatch)(request, *args, **kwargs)
 
 
 # ========================================
 # Alerts/Notifications View
 # ========================================
 
-class AlertsView(TemplateView):
+class AlertsView(StaticPageView):
     """
     Static alerts and notifications page
     """
     template_name = 'dashboard/alerts.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['app_name'] = 'CemERP'
-        context['company_name'] = 'Cement Industry Management'
-        
-        return context
 
 
 # ========================================
 # Settings View
 # ========================================
 
-class SettingsView(TemplateView):
+class SettingsView(StaticPageView):
     """
     Static settings and configuration page
     """
     template_name = 'dashboard/settings.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['app_name'] = 'CemERP'
-        context['company_name'] = 'Cement Industry Management'
-        
-        return context
 
 
 # ========================================
 # Support/Help View
 # ========================================
 
-class SupportView(TemplateView):
+class SupportView(StaticPageView):
     """
     Static support and help center page
     """
     template_name = 'dashboard/support.html'
-    
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        context['app_name'] = 'CemERP'
-        context['company_name'] = 'Cement Industry Management'
-        
-        return context
-
-
-
-
-
@@ -0,0 +1,24 @@
+"""
+Shared widget attributes for dashboard forms
+"""
+from types import MappingProxyType
+
+__all__ = ['FORM_INPUT', 'FORM_CONTROL', 'input_attrs', 'control_attrs']
+
+# Read-only base attrs shared by every widget of the same style
+FORM_INPUT = MappingProxyType({'class': 'form-input'})
+FORM_CONTROL = MappingProxyType({'class': 'form-control'})
+
+
+def input_attrs(**extra):
+    """
+    Widget attrs for the .form-input style used by vendor, driver and stock forms
+    """
+    return {**FORM_INPUT, **extra}
+
+
+def control_attrs(**extra):
+    """
+    Widget attrs for the .form-control style used by order forms
+    """
+    return {**FORM_CONTROL, **extra}